@@ -0,0 +1,114 @@
+"""
+보고서 행 생성 벤치마크: 기존 render_report 루프 vs builder.rows.build_case_rows
+
+    python benchmarks/bench_rows.py [케이스 수]
+
+합성 TestFileResult 로 두 구현의 결과가 같은지 확인한 뒤 소요 시간을 비교한다.
+"""
+import html as html_lib
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from gtest_report.parser import TestCaseResult, TestFileResult  # noqa: E402
+from gtest_report.builder.rows import build_case_rows  # noqa: E402
+
+ICON_FILES = {
+    "passed": "gtest_report_ok.png",
+    "success": "gtest_report_ok.png",
+    "failed": "gtest_report_notok.png",
+    "skipped": "gtest_report_disable.png",
+}
+
+
+def legacy_format_icon(status):
+    fn = ICON_FILES.get(status, ICON_FILES["skipped"])
+    return (
+        f'<img src="html_resources/{fn}" alt="{status}" '
+        'class="icon" width="16" height="16"/>'
+    )
+
+
+def legacy_sanitize_id(text):
+    return "".join(c if c.isalnum() or c == "_" else "_" for c in text)
+
+
+def legacy_rows(results):
+    failed_rows = ['<tr><th>Test Suite</th><th>Test Case</th><th>Result</th><th>Reason</th></tr>']
+    skipped_rows = ['<tr><th>Test Suite</th><th>Test Case</th><th>Result</th><th>Reason</th></tr>']
+    for fr in results:
+        for case in fr.cases:
+            if case.status == "failed":
+                suite, case_name = case.name.split(".", 1)
+                aid = legacy_sanitize_id(f"{fr.filename}_{case.name}")
+                link = f'<a href="#test_{aid}">{case_name}</a>'
+                reason = html_lib.escape(case.failure_message or "")
+                failed_rows.append(f"<tr><td>{suite}</td><td>{link}</td><td>{legacy_format_icon(case.status)}</td><td>{reason}</td></tr>")
+            elif case.status == "skipped":
+                suite, case_name = case.name.split(".", 1)
+                aid = legacy_sanitize_id(f"{fr.filename}_{case.name}")
+                link = f'<a href="#test_{aid}">{case_name}</a>'
+                reason = html_lib.escape(case.failure_message or "")
+                skipped_rows.append(f"<tr><td>{suite}</td><td>{link}</td><td>{legacy_format_icon(case.status)}</td><td>{reason}</td></tr>")
+
+    detail_parts = []
+    for fr in results:
+        detail_parts.append(f'<h3 id="detail_{fr.filename}">{fr.filename}</h3>')
+        detail_parts.append("""<table class="utests">
+  <colgroup>
+    <col style="width:46%;">
+    <col style="width:46%;">
+    <col style="width:8%;">
+  </colgroup>""")
+        detail_parts.append('<tr><th>Test Suite</th><th>Test Case</th><th>Result</th></tr>')
+        for case in fr.cases:
+            suite, case_name = case.name.split(".", 1)
+            aid = legacy_sanitize_id(f"{fr.filename}_{case.name}")
+            detail_parts.append(
+                f'<tr id="test_{aid}"><td>{suite}</td><td>{case_name}</td><td>{legacy_format_icon(case.status)}</td></tr>'
+            )
+        detail_parts.append("</table>")
+    return failed_rows, skipped_rows, detail_parts
+
+
+def make_results(n_cases, cases_per_file=5000, cases_per_suite=20):
+    results = []
+    for f in range(0, n_cases, cases_per_file):
+        cases = []
+        for i in range(f, min(f + cases_per_file, n_cases)):
+            status = "failed" if i % 37 == 0 else "skipped" if i % 53 == 0 else "success"
+            msg = "expected <1> & got <2>" if status != "success" else ""
+            cases.append(TestCaseResult(f"Suite{i // cases_per_suite}.Case/{i}<param>", 0.01, status, msg))
+        results.append(TestFileResult(f"result-{f}.xml", len(cases), 0, 0, 0.0, None, cases))
+    return results
+
+
+def bench(func, results, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(results)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    n_cases = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    results = make_results(n_cases)
+
+    if legacy_rows(results) != build_case_rows(results):
+        print("MISMATCH: build_case_rows output differs from legacy rows")
+        sys.exit(1)
+
+    legacy = bench(legacy_rows, results)
+    fast = bench(build_case_rows, results)
+    print(f"cases: {n_cases:,}")
+    print(f"legacy rows : {legacy:.3f} s ({n_cases / legacy:,.0f} cases/s)")
+    print(f"fast rows   : {fast:.3f} s ({n_cases / fast:,.0f} cases/s)")
+    print(f"speedup     : {legacy / fast:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+프로세스 안에서 보고서를 만드는 Python API
+- 테스트 러너가 가진 XML(bytes / file-like)이나 TestFileResult 를 임시 파일 없이 바로 사용
+- add_results(...) 로 단계별 결과를 여러 번 나눠 추가한 뒤 render(...) 로 한 번에 출력
+- 출력 파일 구성은 gtest-report CLI 와 같다 (index.html, <TYPE>_Report.html, SA_Report*.html)
+
+    from gtest_report.api import ReportBuilder
+
+    builder = ReportBuilder("PARA")
+    builder.add_results("UT", xml_bytes, name="core_test.xml")
+    builder.add_results("SCT", [result_a, result_b])
+    builder.add_sa(open("report.xml", "rb"))
+    builder.render("out", branch="develop", build_number="42")
+"""
+from datetime import datetime
+from pathlib import Path
+
+from .parser import TestCaseResult, TestFileResult, parse_file, parse_files, summarize
+from .builder.html_builder import install_resources, render_report, render_sa_report
+from .async_io import BackgroundWriter
+from .sa_component_report_generator import (
+    DEFAULT_ROW_BUDGET, collect_components, render_component, summarize_components,
+)
+from .sa_summary_parser import parse_sa_file_enhanced
+from .sa_spill import ViolationStore
+from .stages import Stage, DEFAULT_STAGES
+from .cli import index_cells, render_index
+
+__all__ = [
+    "ReportBuilder",
+    "TestCaseResult",
+    "TestFileResult",
+    "parse_file",
+    "parse_files",
+    "parse_sa_file_enhanced",
+    "render_report",
+]
+
+
+def _iter_sources(sources):
+    """list/tuple 은 펼치고, 나머지(경로, bytes, file-like, TestFileResult)는 그대로"""
+    for src in sources:
+        if isinstance(src, (list, tuple)):
+            yield from _iter_sources(src)
+        else:
+            yield src
+
+
+class ReportBuilder:
+    """
+    단계별 테스트 결과와 SA report 를 메모리에 모아 보고서 폴더 하나를 생성.
+    입력 스트림은 add_* 호출 시점에 바로 읽으므로 호출 뒤에 닫아도 된다.
+    """
+
+    def __init__(self, project_name: str, row_budget: int = DEFAULT_ROW_BUDGET,
+                 memory_limit: int | None = None):
+        self.project_name = project_name
+        self.row_budget = row_budget
+        self.memory_limit = memory_limit
+        self.stages = list(DEFAULT_STAGES)
+        self._results = {}
+        self._store = None
+        self._components = {}
+
+    def _stage(self, stage_type: str) -> Stage:
+        for stage in self.stages:
+            if stage.type == stage_type:
+                return stage
+        # CLI 의 discover_stages 처럼 알 수 없는 단계는 이름을 그대로 쓰는 단계로 추가
+        stage = Stage(stage_type, stage_type)
+        self.stages.append(stage)
+        return stage
+
+    def add_results(self, stage_type: str, *sources, name: str | None = None) -> list[TestFileResult]:
+        """
+        stage_type(예: "UT") 단계에 결과 추가. sources 의 각 항목은
+        TestFileResult, XML 경로, bytes, file-like 객체 또는 그 목록.
+        name 은 bytes/stream 하나를 추가할 때 보고서에 표시할 파일명이며,
+        여러 항목과 함께 주면 파일명이 겹치므로 ValueError.
+        추가된 TestFileResult 목록을 반환한다.
+        """
+        sources = list(_iter_sources(sources))
+        if name is not None and len(sources) > 1:
+            raise ValueError(f"name={name!r} can only be used with a single source, got {len(sources)}")
+        stage = self._stage(stage_type)
+        added = []
+        for src in sources:
+            added.append(src if isinstance(src, TestFileResult) else parse_file(src, name=name))
+        # UIT 처럼 다른 단계의 XML 을 쓰는 단계는 그 단계(source) 결과에 합친다
+        self._results.setdefault(stage.source, []).extend(added)
+        return added
+
+    def results(self, stage_type: str) -> list[TestFileResult]:
+        return list(self._results.get(self._stage(stage_type).source, []))
+
+    def add_sa(self, source):
+        """
+        SA report.xml (경로, bytes, file-like) 을 읽어 컴포넌트별로 집계.
+        한 번만 읽으므로 스트림도 사용할 수 있으며, 다시 호출하면 이전 SA 결과를 대체한다.
+        """
+        if self._store is not None:
+            self._store.close()
+        self._store = ViolationStore(self.memory_limit)
+        self._components = collect_components(source, self._store)
+
+    def sa_data(self) -> dict:
+        """index / SA_Report.html 에 쓰는 parse_sa_file_enhanced 형태의 SA 집계"""
+        return summarize_components(self._components) if self._store is not None else {}
+
+    def render(self, output_dir, branch=None, release_tag=None, commit_id=None,
+               build_number=None, report_date: str | None = None) -> Path:
+        """모든 보고서와 index.html 을 output_dir 에 기록하고 index.html 경로 반환"""
+        output_root = Path(output_dir)
+        output_root.mkdir(parents=True, exist_ok=True)
+        install_resources(output_root)
+        if report_date is None:
+            report_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        index_rows = []
+        sa_data = self.sa_data()
+        with BackgroundWriter() as writer:
+            for stage in self.stages:
+                results = self._results.get(stage.source, [])
+                parsed = summarize(results)
+                render_report(self.project_name, stage.name, [], output_root / f"{stage.type}_Report.html",
+                              writer=writer, parsed=parsed)
+                # 결과가 없으면 index_cells 가 NT 셀을 만든다
+                index_rows.append(index_cells(stage, results, parsed))
+
+            if sa_data:
+                writer.submit(output_root / "SA_Report.html", render_sa_report(self.project_name, sa_data))
+                for comp, data in self._components.items():
+                    writer.submit(output_root / f"SA_Report_{comp}.html",
+                                  render_component(comp, data, self._store, self.row_budget))
+
+        render_index(
+            output_root,
+            project_name=self.project_name,
+            branch=branch,
+            release_tag=release_tag,
+            commit_id=commit_id,
+            build_number=build_number,
+            report_date=report_date,
+            index_rows=index_rows,
+            sa_data=sa_data,
+        )
+        return output_root / "index.html"
+
+    def close(self):
+        """SA 위반 목록(임시 파일 포함) 해제"""
+        if self._store is not None:
+            self._store.close()
+            self._store = None
+            self._components = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -0,0 +1,136 @@
+"""
+입력 XML 선읽기(read-ahead)와 출력 HTML 백그라운드 쓰기 도구
+- ReadAhead: 스레드 풀로 다음 파일들을 미리 읽어 파싱과 I/O 를 겹침
+- BackgroundWriter: 렌더링된 페이지를 별도 스레드에서 기록 (큐 크기로 메모리 제한)
+"""
+import os
+import queue
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# 동시에 미리 읽어 둘 입력 파일 수
+DEFAULT_READ_AHEAD = 8
+# 기록 대기 중인 페이지 최대 개수 (초과 시 submit 이 대기)
+DEFAULT_WRITE_QUEUE = 4
+# write_stream 이 한 번에 모아서 쓰는 문자 수
+STREAM_CHUNK = 1 << 20
+
+
+def _read_bytes(path) -> bytes | None:
+    # 경로가 아닌 입력(bytes, file-like)은 읽지 않고 호출자에게 그대로 맡긴다
+    if not isinstance(path, (str, os.PathLike)):
+        return None
+    return Path(path).read_bytes()
+
+
+class ReadAhead:
+    """
+    경로 목록을 순서대로 (path, bytes) 로 돌려주는 이터레이터.
+    현재 파일을 처리하는 동안 뒤따르는 depth 개 파일을 스레드 풀에서 미리 읽는다.
+    경로가 아닌 항목은 (항목, None) 으로 돌려준다.
+    """
+
+    def __init__(self, paths, depth: int = DEFAULT_READ_AHEAD):
+        self.paths = list(paths)
+        self.depth = max(depth, 1)
+
+    def __iter__(self):
+        if not self.paths:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.depth, len(self.paths))) as pool:
+            pending = deque()
+            it = iter(self.paths)
+            for p in it:
+                pending.append((p, pool.submit(_read_bytes, p)))
+                if len(pending) >= self.depth:
+                    break
+            while pending:
+                p, fut = pending.popleft()
+                nxt = next(it, None)
+                if nxt is not None:
+                    pending.append((nxt, pool.submit(_read_bytes, nxt)))
+                yield p, fut.result()
+
+
+class BackgroundWriter:
+    """
+    페이지 기록 전용 스레드.
+    submit() 은 큐가 가득 차면 대기하므로 메모리에 쌓이는 페이지 수가 제한된다.
+    기록 중 발생한 첫 예외는 close() 에서 다시 발생시킨다.
+    with 블록이 이미 예외로 끝나는 경우에는 그 예외를 가리지 않도록 기록 오류를 로그로만 남긴다.
+    """
+
+    def __init__(self, max_pending: int = DEFAULT_WRITE_QUEUE):
+        self._queue = queue.Queue(maxsize=max(max_pending, 1))
+        self._error = None
+        self._thread = threading.Thread(target=self._run, name="gtest-report-writer", daemon=True)
+        self._thread.start()
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                break
+            path, text = item
+            if self._error is None:
+                try:
+                    Path(path).write_text(text, encoding="utf-8")
+                except Exception as e:
+                    self._error = e
+
+    def submit(self, path, text: str):
+        if self._error is not None:
+            raise self._error
+        self._queue.put((path, text))
+
+    def _join(self):
+        self._queue.put(None)
+        self._thread.join()
+
+    def close(self):
+        self._join()
+        if self._error is not None:
+            raise self._error
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self.close()
+            return
+        self._join()
+        if self._error is not None:
+            print(f"[ERROR] background write failed: {self._error}", file=sys.stderr)
+
+
+def write_page(path, text: str, writer: BackgroundWriter | None = None):
+    """writer 가 있으면 백그라운드로, 없으면 즉시 기록."""
+    if writer is not None:
+        writer.submit(path, text)
+    else:
+        Path(path).write_text(text, encoding="utf-8")
+
+
+def write_stream(path, chunks, writer: BackgroundWriter | None = None):
+    """
+    문자열 조각 이터레이터(예: Jinja Template.generate)를 기록.
+    writer 가 없으면 전체 페이지를 만들지 않고 STREAM_CHUNK 단위로 모아 바로 쓴다.
+    """
+    if writer is not None:
+        writer.submit(path, "".join(chunks))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        buf = []
+        size = 0
+        for chunk in chunks:
+            buf.append(chunk)
+            size += len(chunk)
+            if size >= STREAM_CHUNK:
+                f.write("".join(buf))
+                buf.clear()
+                size = 0
+        f.write("".join(buf))
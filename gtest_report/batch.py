@@ -0,0 +1,159 @@
+"""
+여러 프로젝트 보고서를 하나의 프로세스 풀로 일괄 생성 (gtest-report-batch)
+
+manifest(JSON) 예:
+{
+  "projects": [
+    {"project": "PARA", "input_dir": "in/PARA", "output_dir": "out/PARA",
+     "branch": "develop", "tag": "v1.2.3", "commit": "abc123", "build": "42"}
+  ]
+}
+상대 경로는 manifest 파일 위치 기준으로 해석한다.
+"""
+import sys
+import json
+import shutil
+import argparse
+import tempfile
+from pathlib import Path
+from datetime import datetime
+
+from .builder.html_builder import install_resources
+from .async_io import BackgroundWriter
+from .sa_component_report_generator import DEFAULT_ROW_BUDGET
+from .stages import discover_stages
+from .scheduler import CostHistory, run_units
+from .cli import project_units, index_cells, render_index
+
+
+class BatchProject:
+    def __init__(self, project: str, input_dir: Path, output_dir: Path,
+                 branch=None, tag=None, commit=None, build=None):
+        self.project = project
+        self.input_dir = input_dir
+        self.output_dir = output_dir
+        self.branch = branch
+        self.tag = tag
+        self.commit = commit
+        self.build = build
+
+
+def load_manifest(manifest_path: Path) -> list[BatchProject]:
+    """manifest JSON 을 읽어 BatchProject 목록으로 변환"""
+    data = json.loads(manifest_path.read_text(encoding="utf-8"))
+    entries = data["projects"] if isinstance(data, dict) else data
+    base = manifest_path.parent
+
+    projects = []
+    for i, entry in enumerate(entries):
+        try:
+            name = entry["project"]
+            input_dir = base / entry["input_dir"]
+            output_dir = base / entry["output_dir"]
+        except KeyError as e:
+            raise RuntimeError(f"{manifest_path}: projects[{i}] is missing {e}")
+        projects.append(BatchProject(
+            name, input_dir, output_dir,
+            branch=entry.get("branch"),
+            tag=entry.get("tag"),
+            commit=entry.get("commit"),
+            build=entry.get("build"),
+        ))
+    return projects
+
+
+def run_batch(projects: list[BatchProject], max_workers: int | None = None,
+              row_budget: int = DEFAULT_ROW_BUDGET, memory_limit: int | None = None) -> int:
+    """
+    모든 프로젝트의 작업 단위를 추정 비용이 큰 순서로 하나의 풀에 제출하고,
+    프로젝트별 작업이 모두 끝나는 대로 index.html 을 생성한다.
+    실패한 작업 수를 반환.
+    """
+    report_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    failures = 0
+
+    # 프로젝트별 단계 목록, 비용 기록, 미완료 작업 수와 수집된 결과
+    stages = {}
+    histories = {}
+    pending = {}
+    index_rows = {}
+    sa_results = {}
+
+    # parse_chunk 작업이 단계 작업에 넘기는 인코딩 파일 위치 (모든 프로젝트 공용)
+    work_dir = Path(tempfile.mkdtemp(prefix="gtest_report_"))
+    units = []
+    for pi, proj in enumerate(projects):
+        proj.output_dir.mkdir(parents=True, exist_ok=True)
+        install_resources(proj.output_dir)
+        stages[pi] = discover_stages(proj.input_dir)
+        histories[pi] = CostHistory.for_input(proj.input_dir)
+        index_rows[pi] = {}
+        sa_results[pi] = {}
+        proj_units = project_units(proj.project, proj.input_dir, proj.output_dir, stages[pi],
+                                   histories[pi], row_budget=row_budget,
+                                   memory_limit=memory_limit, tag=pi, work_dir=work_dir)
+        pending[pi] = len(proj_units)
+        units.extend(proj_units)
+
+    try:
+        with BackgroundWriter() as writer:
+            for unit, success, value in run_units(units, max_workers=max_workers):
+                pi = unit.tag
+                proj = projects[pi]
+                if success:
+                    if unit.kind == "stage":
+                        index_rows[pi][unit.key] = value
+                    elif unit.kind == "sa_summary":
+                        sa_results[pi] = value
+                else:
+                    failures += 1
+                    print(f"[ERROR] {proj.project} {unit.key}: {value}", file=sys.stderr)
+
+                pending[pi] -= 1
+                if pending[pi] == 0:
+                    histories[pi].save()
+                    rows = [index_rows[pi].get(s.type) or index_cells(s, []) for s in stages[pi]]
+                    render_index(
+                        proj.output_dir,
+                        project_name=proj.project,
+                        branch=proj.branch,
+                        release_tag=proj.tag,
+                        commit_id=proj.commit,
+                        build_number=proj.build,
+                        report_date=report_date,
+                        index_rows=rows,
+                        sa_data=sa_results[pi],
+                        writer=writer,
+                    )
+                    print(f"  → {proj.project}: {proj.output_dir / 'index.html'}")
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Generate GTest HTML reports for multiple projects with one shared worker pool"
+    )
+    parser.add_argument("manifest", help="프로젝트 목록 manifest(JSON) 경로")
+    parser.add_argument("--workers", type=int, default=None, help="워커 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--sa-row-budget", type=int, default=DEFAULT_ROW_BUDGET,
+                        help="SA 컴포넌트 페이지당 최대 상세 행 수")
+    parser.add_argument("--memory-limit", type=int, default=None, metavar="MB",
+                        help="SA 위반 목록 메모리 예산(MB). 초과분은 임시 파일로 내보냄")
+    args = parser.parse_args()
+
+    projects = load_manifest(Path(args.manifest))
+    print(f"Starting batch report generation: {len(projects)} project(s)")
+    memory_limit = args.memory_limit * 1024 * 1024 if args.memory_limit else None
+    failures = run_batch(projects, max_workers=args.workers, row_budget=args.sa_row_budget,
+                         memory_limit=memory_limit)
+    if failures:
+        print(f"Batch finished with {failures} failed task(s).", file=sys.stderr)
+        sys.exit(1)
+    print("All projects processed successfully.")
+
+
+if __name__ == "__main__":
+    main()
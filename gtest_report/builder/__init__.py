@@ -6,7 +6,7 @@ gtest_report.builder 패키지
 """
 
 from .utils import row_html, sanitize_id, jsonify
-from .chart_builder import build_chart_data
+from .chart_builder import build_chart_data, build_ranked_series
 from .html_builder import render_report
 
 __all__ = [
@@ -14,5 +14,6 @@ __all__ = [
     "sanitize_id",
     "jsonify",
     "build_chart_data",
+    "build_ranked_series",
     "render_report",
 ]
@@ -4,8 +4,9 @@
 Chart.js용 데이터 준비:
 - Execution Rate (Executed vs Skipped)
 - Success Rate  (Success  vs Failure)
+- 정적분석 상위 N 개 + Other 순위 시리즈
 """
-from typing import Dict
+from typing import Any, Dict
 
 from .utils import jsonify
 
@@ -27,3 +28,44 @@ def build_chart_data(
         "succ_labels": jsonify(succ_labels),
         "succ_values": jsonify(succ_values),
     }
+
+
+# 막대 차트에 개별로 표시할 최대 항목 수 (나머지는 "Other" 로 합산)
+DEFAULT_TOP_N = 20
+# 펼침 순위표에 나열할 최대 항목 수 (나머지는 건수만 표시)
+DEFAULT_RANKED_LIMIT = 500
+
+
+def build_ranked_series(
+    counts: Dict[str, int], top_n: int = DEFAULT_TOP_N, other_label: str = "Other",
+    ranked_limit: int = DEFAULT_RANKED_LIMIT,
+) -> Dict[str, Any]:
+    """
+    건수 딕셔너리를 내림차순으로 정렬해 상위 top_n 개와 "Other" 버킷으로 나눈다.
+    차트에는 labels/data(리스트, 최대 top_n + 1 개 — 템플릿에서 |tojson), 표에는 top/ranked 를 사용.
+    ranked 는 상위 ranked_limit 개까지만 담고, 나머지는 ranked_hidden/ranked_hidden_count 로 센다.
+    """
+    ranked = sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))
+    top = ranked[:top_n]
+    rest = ranked[top_n:]
+    other_count = sum(v for _, v in rest)
+    listed = ranked[:ranked_limit]
+    unlisted = ranked[ranked_limit:]
+
+    labels = [k for k, _ in top]
+    values = [v for _, v in top]
+    if rest:
+        labels.append(other_label)
+        values.append(other_count)
+
+    return {
+        "labels": labels,
+        "data": values,
+        "top": [(k, f"{v:,}") for k, v in top],
+        "ranked": [(k, f"{v:,}") for k, v in listed],
+        "ranked_total": len(ranked),
+        "ranked_hidden": len(unlisted),
+        "ranked_hidden_count": f"{sum(v for _, v in unlisted):,}",
+        "other_keys": len(rest),
+        "other_count": f"{other_count:,}",
+    }
@@ -1,26 +1,53 @@
 import shutil
-import html as html_lib
+from functools import lru_cache
 from pathlib import Path
 from jinja2 import Environment, FileSystemLoader, select_autoescape
 from collections import defaultdict
 
-from ..parser import parse_files
-from .utils import row_html, sanitize_id, jsonify
-
-ICON_FILES = {
-    "passed": "gtest_report_ok.png",
-    "success": "gtest_report_ok.png",
-    "failed": "gtest_report_notok.png",
-    "skipped": "gtest_report_disable.png",
-}
-
-def format_icon(status: str) -> str:
-    fn = ICON_FILES.get(status, ICON_FILES["skipped"])
-    return (
-        f'<img src="html_resources/{fn}" alt="{status}" '
-        'class="icon" width="16" height="16"/>'
+from ..parser import parse_files, summarize
+from ..async_io import write_page, write_stream
+from .utils import row_html, jsonify
+from .chart_builder import build_ranked_series
+from .rows import format_icon, build_case_rows
+
+TEMPLATE_DIR = Path(__file__).parent.parent / "templates"
+RESOURCE_DIR = Path(__file__).parent.parent / "html_resources"
+
+
+@lru_cache(maxsize=None)
+def get_environment() -> Environment:
+    """
+    프로세스당 하나의 Jinja2 Environment 를 공유.
+    컴파일된 템플릿이 Environment 에 캐시되므로 여러 보고서/프로젝트를 렌더링해도
+    템플릿 컴파일은 한 번만 일어난다.
+    """
+    return Environment(
+        loader=FileSystemLoader(str(TEMPLATE_DIR)),
+        autoescape=select_autoescape(["html"]),
     )
 
+
+def install_resources(output_dir: Path):
+    """
+    output_dir/html_resources 에 CSS/JS/아이콘 복사.
+    크기와 수정 시각이 같은 파일은 건너뛰므로 반복 호출 비용이 거의 없다.
+    """
+    dst_dir = output_dir / "html_resources"
+    dst_dir.mkdir(parents=True, exist_ok=True)
+    for src in RESOURCE_DIR.iterdir():
+        if not src.is_file():
+            continue
+        dst = dst_dir / src.name
+        src_stat = src.stat()
+        try:
+            dst_stat = dst.stat()
+            if dst_stat.st_size == src_stat.st_size and int(dst_stat.st_mtime) == int(src_stat.st_mtime):
+                continue
+        except FileNotFoundError:
+            pass
+        shutil.copy2(src, dst)
+
+
 def aggregate_suites_by_file(results):
     suite_by_file = defaultdict(list)
     suite_status = {}
@@ -50,31 +77,51 @@ def aggregate_suites_by_file(results):
     skipped = sum(1 for s in suite_status.values() if s == "skipped")
     return total, failures, skipped, timestamps, suite_by_file
 
-def render_report(project_name, report_name, xml_paths, output_path,
-                  sa_xml_path: Path | None = None, sa_data: dict | None = None):
-    tpl_dir = Path(__file__).parent.parent / "templates"
-    env = Environment(
-        loader=FileSystemLoader(str(tpl_dir)),
-        autoescape=select_autoescape(["html"]),
-    )
-    tpl = env.get_template("report.html")
+UIT_REPORT_NAME = "Unit Integration Test"
+
 
+def render_report(project_name, report_name, xml_paths, output_path,
+                  sa_xml_path: Path | None = None, sa_data: dict | None = None,
+                  writer=None, parsed=None, results=None):
+    """
+    parsed 에 parse_files 결과를 넘기면 xml_paths 를 다시 파싱하지 않는다.
+    results 에 TestFileResult 목록을 넘기면 xml_paths 대신 사용한다.
+    xml_paths 에는 경로 외에 bytes / file-like 객체도 넣을 수 있다.
+    """
     if sa_xml_path and sa_data:
-        tpl_sa = env.get_template("sa_report.html")
-        html = tpl_sa.render(
-            title=f"{project_name} - Static Analysis Report",
-            sa_total_violations=f"{sa_data.get('total_violations', 0):,}",
-            sa_component_counts={k: f"{v:,}" for k, v in sa_data.get("comp_counts", {}).items()},
-            sa_severity_counts={k: f"{v:,}" for k, v in sa_data.get("severity_counts", {}).items()},
-            sa_ruleid_counts={k: f"{v:,}" for k, v in sa_data.get("ruleid_counts", {}).items()},
-            sa_data=sa_data,
-        )
-        output_path.write_text(html, encoding="utf-8")
+        write_page(output_path, render_sa_report(project_name, sa_data), writer)
         return
 
-    results, _, _, _, _ = parse_files(xml_paths)
+    if parsed is None:
+        parsed = summarize(results) if results is not None else parse_files(xml_paths)
+    if report_name != UIT_REPORT_NAME:
+        install_resources(output_path.parent)
+    write_stream(output_path, generate_report(project_name, report_name, parsed), writer)
+
+
+def render_sa_report(project_name, sa_data: dict) -> str:
+    """parse_sa_file_enhanced 결과로 SA_Report.html 렌더링"""
+    tpl_sa = get_environment().get_template("sa_report.html")
+    return tpl_sa.render(
+        title=f"{project_name} - Static Analysis Report",
+        sa_total_violations=f"{sa_data.get('total_violations', 0):,}",
+        sa_component_counts={k: f"{v:,}" for k, v in sa_data.get("comp_counts", {}).items()},
+        sa_severity_counts={k: f"{v:,}" for k, v in sa_data.get("severity_counts", {}).items()},
+        comp_rank=build_ranked_series(sa_data.get("comp_counts", {})),
+        ruleid_rank=build_ranked_series(sa_data.get("ruleid_counts", {})),
+        sa_data=sa_data,
+    )
 
-    if report_name == "Unit Integration Test":
+
+def generate_report(project_name, report_name, parsed):
+    """
+    parse_files 결과 (results, total, failures, skipped, timestamps) 로
+    테스트 보고서 HTML 조각을 생성 (Template.generate 이터레이터).
+    """
+    tpl = get_environment().get_template("report.html")
+    results, total, failures, skipped, timestamps = parsed
+
+    if report_name == UIT_REPORT_NAME:
         total, failures, skipped, timestamps, suite_by_file = aggregate_suites_by_file(results)
         executed = total - skipped
         passed = executed - failures
@@ -119,7 +166,7 @@ def render_report(project_name, report_name, xml_paths, output_path,
             "pass_values": jsonify([round(passed / total * 100, 2)] if total else []),
         }
 
-        html = tpl.render(
+        return tpl.generate(
             title=f"{project_name} {report_name}",
             overall_rows=overall_rows,
             failed_rows=failed_rows,
@@ -128,13 +175,8 @@ def render_report(project_name, report_name, xml_paths, output_path,
             **charts,
             report_name=report_name,
         )
-        output_path.write_text(html, encoding="utf-8")
-        return
-
-    # UT 등 기존 로직은 그대로 유지 (필요 시 요청 주시면 포함해드립니다)
 
     # UT 등 기본 처리
-    results, total, failures, skipped, timestamps = parse_files(xml_paths)
     executed = total - skipped
     passed = executed - failures
 
@@ -150,11 +192,6 @@ def render_report(project_name, report_name, xml_paths, output_path,
 
     earliest = min(timestamps).strftime("%Y-%m-%d %H:%M:%S") if timestamps else ""
 
-    res_src = Path(__file__).parent.parent / "html_resources"
-    res_dst = output_path.parent / "html_resources"
-    res_dst.mkdir(exist_ok=True)
-    shutil.copytree(res_src, res_dst, dirs_exist_ok=True)
-
     overall_rows = [
         row_html(["Total XML files", str(len(results))]),
         row_html(["Total Tests", str(total)]),
@@ -168,22 +205,7 @@ def render_report(project_name, report_name, xml_paths, output_path,
         row_html(["Earliest Timestamp", earliest]),
     ]
 
-    failed_rows = ['<tr><th>Test Suite</th><th>Test Case</th><th>Result</th><th>Reason</th></tr>']
-    skipped_rows = ['<tr><th>Test Suite</th><th>Test Case</th><th>Result</th><th>Reason</th></tr>']
-    for fr in results:
-        for case in fr.cases:
-            if case.status == "failed":
-                suite, case_name = case.name.split(".", 1)
-                aid = sanitize_id(f"{fr.filename}_{case.name}")
-                link = f'<a href="#test_{aid}">{case_name}</a>'
-                reason = html_lib.escape(case.failure_message or "")
-                failed_rows.append(f"<tr><td>{suite}</td><td>{link}</td><td>{format_icon(case.status)}</td><td>{reason}</td></tr>")
-            elif case.status == "skipped":
-                suite, case_name = case.name.split(".", 1)
-                aid = sanitize_id(f"{fr.filename}_{case.name}")
-                link = f'<a href="#test_{aid}">{case_name}</a>'
-                reason = html_lib.escape(case.failure_message or "")
-                skipped_rows.append(f"<tr><td>{suite}</td><td>{link}</td><td>{format_icon(case.status)}</td><td>{reason}</td></tr>")
+    failed_rows, skipped_rows, detail_parts = build_case_rows(results)
 
     file_rows = [
         '<tr><th>Test File</th><th>Total Tests</th><th>Failed</th><th>Timestamp</th></tr>'
@@ -196,24 +218,6 @@ def render_report(project_name, report_name, xml_paths, output_path,
             f"<td>{fr.total}</td><td>{fh}</td><td>{ts}</td></tr>"
         )
 
-    detail_parts = []
-    for fr in results:
-        detail_parts.append(f'<h3 id="detail_{fr.filename}">{fr.filename}</h3>')
-        detail_parts.append("""<table class="utests">
-  <colgroup>
-    <col style="width:46%;">
-    <col style="width:46%;">
-    <col style="width:8%;">
-  </colgroup>""")
-        detail_parts.append('<tr><th>Test Suite</th><th>Test Case</th><th>Result</th></tr>')
-        for case in fr.cases:
-            suite, case_name = case.name.split(".", 1)
-            aid = sanitize_id(f"{fr.filename}_{case.name}")
-            detail_parts.append(
-                f'<tr id="test_{aid}"><td>{suite}</td><td>{case_name}</td><td>{format_icon(case.status)}</td></tr>'
-            )
-        detail_parts.append("</table>")
-
     charts = {
         "exec_labels": jsonify(["Execution Rate (%)"]),
         "exec_values": jsonify([round((passed + failures + skipped_with_reason) / total * 100, 2)] if total else []),
@@ -223,7 +227,7 @@ def render_report(project_name, report_name, xml_paths, output_path,
         "pass_values": jsonify([round(passed / total * 100, 2)] if total else []),
     }
 
-    html = tpl.render(
+    return tpl.generate(
         title=f"{project_name} {report_name}",
         overall_rows=overall_rows,
         failed_rows=failed_rows,
@@ -233,4 +237,3 @@ def render_report(project_name, report_name, xml_paths, output_path,
         **charts,
         report_name=report_name,
     )
-    output_path.write_text(html, encoding="utf-8")
@@ -0,0 +1,85 @@
+# File: gtest_report/builder/rows.py
+
+"""
+테스트 보고서 표 행(row) 고속 생성:
+- 상태별 아이콘 HTML 미리 생성
+- Test Suite / 파일명 ID 조각 캐시 (sanitize 는 문자 단위라 조각별로 나눠 처리 가능)
+- 실패/Skip/상세 행을 케이스 한 번 순회로 생성
+결과 문자열은 기존 render_report 루프와 동일하다.
+"""
+import html as html_lib
+
+from .utils import sanitize_id
+
+ICON_FILES = {
+    "passed": "gtest_report_ok.png",
+    "success": "gtest_report_ok.png",
+    "failed": "gtest_report_notok.png",
+    "skipped": "gtest_report_disable.png",
+}
+
+ICON_HTML = {
+    status: (
+        f'<img src="html_resources/{fn}" alt="{status}" '
+        'class="icon" width="16" height="16"/>'
+    )
+    for status, fn in ICON_FILES.items()
+}
+
+REASON_HEADER = '<tr><th>Test Suite</th><th>Test Case</th><th>Result</th><th>Reason</th></tr>'
+DETAIL_TABLE_OPEN = """<table class="utests">
+  <colgroup>
+    <col style="width:46%;">
+    <col style="width:46%;">
+    <col style="width:8%;">
+  </colgroup>"""
+DETAIL_HEADER = '<tr><th>Test Suite</th><th>Test Case</th><th>Result</th></tr>'
+
+
+def format_icon(status: str) -> str:
+    icon = ICON_HTML.get(status)
+    if icon is None:
+        fn = ICON_FILES["skipped"]
+        icon = f'<img src="html_resources/{fn}" alt="{status}" class="icon" width="16" height="16"/>'
+    return icon
+
+
+def build_case_rows(results):
+    """
+    (failed_rows, skipped_rows, detail_parts) 반환.
+    detail_parts 는 파일별 <h3>/<table> 조각과 케이스 행의 목록.
+    """
+    failed_rows = [REASON_HEADER]
+    skipped_rows = [REASON_HEADER]
+    detail_parts = []
+    add_failed = failed_rows.append
+    add_skipped = skipped_rows.append
+    add_detail = detail_parts.append
+    escape = html_lib.escape
+
+    suite_ids = {}
+    for fr in results:
+        file_id = sanitize_id(fr.filename) + "_"
+        add_detail(f'<h3 id="detail_{fr.filename}">{fr.filename}</h3>')
+        add_detail(DETAIL_TABLE_OPEN)
+        add_detail(DETAIL_HEADER)
+        for case in fr.cases:
+            suite, case_name = case.name.split(".", 1)
+            suite_id = suite_ids.get(suite)
+            if suite_id is None:
+                suite_id = suite_ids[suite] = sanitize_id(suite) + "_"
+            aid = file_id + suite_id + sanitize_id(case_name)
+            status = case.status
+            icon = ICON_HTML.get(status) or format_icon(status)
+            add_detail(f'<tr id="test_{aid}"><td>{suite}</td><td>{case_name}</td><td>{icon}</td></tr>')
+            if status == "failed" or status == "skipped":
+                link = f'<a href="#test_{aid}">{case_name}</a>'
+                reason = escape(case.failure_message or "")
+                row = f"<tr><td>{suite}</td><td>{link}</td><td>{icon}</td><td>{reason}</td></tr>"
+                if status == "failed":
+                    add_failed(row)
+                else:
+                    add_skipped(row)
+        add_detail("</table>")
+
+    return failed_rows, skipped_rows, detail_parts
@@ -7,8 +7,12 @@
 - Python 객체 → JSON 문자열
 """
 import json
+import re
 from typing import Any, List
 
+# \W (유니코드) 는 str.isalnum() 도 '_' 도 아닌 문자와 정확히 일치
+_NON_ID_CHARS = re.compile(r"\W")
+
 
 def row_html(cells: List[str], header: bool = False) -> str:
     """
@@ -24,7 +28,7 @@ def sanitize_id(text: str) -> str:
     HTML anchor 용 안전한 ID 생성:
     영문자/숫자/_ 이외 문자는 '_' 로 대체.
     """
-    return "".join(c if c.isalnum() or c == "_" else "_" for c in text)
+    return _NON_ID_CHARS.sub("_", text)
 
 
 def jsonify(obj: Any) -> str:
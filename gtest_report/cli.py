@@ -1,35 +1,58 @@
 import sys
+import shutil
 import argparse
+import tempfile
 import re
 from pathlib import Path
-from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from collections import defaultdict
 from xml.dom.minidom import parse
 
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-
 from .parser import parse_files
-from .builder.html_builder import render_report
-from .sa_component_report_generator import generate_sa_component_reports
+from .builder.html_builder import render_report, get_environment, install_resources
+from .sa_component_report_generator import generate_sa_component_reports, DEFAULT_ROW_BUDGET
 from .sa_summary_parser import parse_sa_file_enhanced
-
-REPORT_TYPES  = ["UT", "UIT", "SCT", "SCIT", "SRT"]
-DISPLAY_NAMES = {
-    "UT":   "Unit Test",
-    "UIT":  "Unit Integration Test",
-    "SCT":  "Component Test",
-    "SCIT": "Component Integration Test",
-    "SRT":  "SW Requirement Test",
+from .async_io import write_page
+from .stages import Stage, DEFAULT_STAGES, discover_stages
+from .scheduler import WorkUnit, CostHistory, input_size, run_units
+from .result_codec import DEFAULT_CHUNK_SIZE, chunk_paths, load_encoded, parse_to_file
+from .preview import PreviewRun
+
+REPORT_TYPES  = [s.type for s in DEFAULT_STAGES]
+DISPLAY_NAMES = {s.type: s.name for s in DEFAULT_STAGES}
+
+# 작업 완료 시 출력할 생성 결과 이름
+UNIT_OUTPUTS = {
+    "stage": "{}_Report.html",
+    "sa_summary": "SA_Report.html",
+    "sa_components": "SA Component detailed reports",
 }
 
-def _worker(task):
-    rtype, project, name, xmls, out_root = task
-    try:
-        render_report(project, name, xmls, out_root / f"{rtype}_Report.html")
-        return (rtype, True, None)
-    except Exception as e:
-        return (rtype, False, str(e))
+def _stage_unit(project, stage: Stage, xmls, out_root: Path, *encoded) -> str:
+    """
+    단계 보고서 생성 후 인덱스 셀 반환 (XML 은 한 번만 파싱).
+    encoded 는 선행 parse_chunk 작업이 만든 인코딩 파일 경로들이며, 있으면 XML 대신 읽는다.
+    """
+    parsed = load_encoded(encoded) if encoded else parse_files(xmls)
+    render_report(project, stage.name, xmls, out_root / f"{stage.type}_Report.html", parsed=parsed)
+    return index_cells(stage, xmls, parsed)
+
+def _sa_summary_unit(project, sa_report_path: Path, out_root: Path, debug: bool) -> dict:
+    """SA_Report.html 생성 후 인덱스용 SA 집계 반환"""
+    sa_data = parse_sa_file_enhanced(sa_report_path, debug=debug)
+    render_report(
+        project,
+        "Static Analysis",
+        [],
+        out_root / "SA_Report.html",
+        sa_xml_path=sa_report_path,
+        sa_data=sa_data,
+    )
+    return sa_data
+
+def _sa_components_unit(sa_report_path: Path, out_root: Path, row_budget: int, memory_limit: int | None):
+    generate_sa_component_reports(sa_report_path, out_root, row_budget=row_budget,
+                                  memory_limit=memory_limit)
 
 def aggregate_suites_from_ut(results):
     """
@@ -63,10 +86,10 @@ def aggregate_suites_from_ut(results):
     suite_results = [{'suite': suite, 'status': status} for suite, status in suite_status_map.items()]
     return total_suites, failures, skipped, timestamps, suite_results
 
-def build_index_cells_for_uit(report_type: str, xml_paths: list[Path]) -> str:
-    name = DISPLAY_NAMES[report_type]
+def build_index_cells_for_uit(report_type: str, xml_paths: list[Path], parsed=None) -> str:
+    name = DISPLAY_NAMES.get(report_type, report_type)
     if xml_paths:
-        results, _, _, _, timestamps = parse_files(xml_paths)
+        results, _, _, _, timestamps = parsed or parse_files(xml_paths)
         total, failures, skipped, _, _ = aggregate_suites_from_ut(results)
         executed = total - skipped
         successes = executed - failures
@@ -91,15 +114,6 @@ def build_index_cells_for_uit(report_type: str, xml_paths: list[Path]) -> str:
 
     return "".join(f"<td>{c}</td>" for c in cells)
 
-def _worker_uit(task):
-    rtype, project, name, xmls, out_root = task
-    try:
-        # UIT는 UT xmls 사용, Test Suite 단위로 집계 (필요시 커스텀 리포트 로직 추가 가능)
-        render_report(project, name, xmls, out_root / f"{rtype}_Report.html")
-        return (rtype, True, None)
-    except Exception as e:
-        return (rtype, False, str(e))
-
 def main():
     parser = argparse.ArgumentParser(
         description="Generate GTest HTML reports and index with Jenkins build info"
@@ -112,6 +126,14 @@ def main():
     parser.add_argument("--commit",   help="Commit ID",        default=None)
     parser.add_argument("--build",    help="Jenkins Build #",   default=None)
     parser.add_argument("--debug",    action="store_true", help="Enable debug mode to output etc.txt")
+    parser.add_argument("--sa-row-budget", type=int, default=DEFAULT_ROW_BUDGET,
+                        help="SA 컴포넌트 페이지당 최대 상세 행 수")
+    parser.add_argument("--memory-limit", type=int, default=None, metavar="MB",
+                        help="SA 위반 목록 메모리 예산(MB). 초과분은 임시 파일로 내보냄")
+    parser.add_argument("--history", default=None, metavar="PATH",
+                        help="작업 실행 시간 기록 파일 (기본: 사용자 캐시 폴더의 입력 폴더별 파일)")
+    parser.add_argument("--preview", action="store_true",
+                        help="실패 목록 위주의 미리보기를 먼저 생성하고 완료된 보고서부터 교체")
     args = parser.parse_args()
 
     project_name = args.project
@@ -125,68 +147,158 @@ def main():
     report_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
     output_root.mkdir(parents=True, exist_ok=True)
+    install_resources(output_root)
 
     print(f"Starting report generation for project: {project_name}")
     print(f"Input: {input_root}, Output: {output_root}\n")
 
-    tasks = []
-    for rtype in REPORT_TYPES:
-        if rtype == "UIT":
-            xmls = list((input_root / "UT").glob("*.xml"))
-            cells_func = build_index_cells_for_uit
-            worker_func = _worker_uit
-        else:
-            xmls = list((input_root / rtype).glob("*.xml"))
-            cells_func = build_index_cells
-            worker_func = _worker
-
-        print(f"Processing {rtype} ({DISPLAY_NAMES[rtype]}): {len(xmls)} XML files found.")
-        tasks.append((rtype, project_name, DISPLAY_NAMES[rtype], xmls, output_root))
-
-    with ProcessPoolExecutor() as executor:
-        future_map = {executor.submit(worker_func, t): t[0] for t in tasks}
-        for future in as_completed(future_map):
-            rtype, success, err = future.result()
+    stages = discover_stages(input_root)
+    history = CostHistory.for_input(input_root, args.history)
+    for stage in stages:
+        print(f"Processing {stage.type} ({stage.name}): {len(stage.xmls(input_root))} XML files found.")
+
+    memory_limit = args.memory_limit * 1024 * 1024 if args.memory_limit else None
+    # parse_chunk 작업이 단계 작업에 넘기는 인코딩 파일 위치
+    work_dir = Path(tempfile.mkdtemp(prefix="gtest_report_"))
+    units = project_units(project_name, input_root, output_root, stages, history,
+                          row_budget=args.sa_row_budget, memory_limit=memory_limit, debug=debug_mode,
+                          work_dir=work_dir)
+
+    index_args = dict(
+        project_name=project_name,
+        branch=branch,
+        release_tag=release_tag,
+        commit_id=commit_id,
+        build_number=build_number,
+        report_date=report_date,
+    )
+    index_rows = {}
+    sa_data = {}
+    stage_by_type = {s.type: s for s in stages}
+    # 미리보기 인덱스는 SA 요약/컴포넌트 페이지가 모두 만들어진 뒤에만 SA 보고서를 링크한다
+    sa_pending = {u.key for u in units if u.kind in ("sa_summary", "sa_components")}
+    preview = None
+    preview_units = []
+    if args.preview:
+        # 미리보기 스캔은 같은 풀에서 가장 먼저 실행되어 본 작업과 겹쳐 진행된다
+        preview = PreviewRun(project_name, input_root, output_root, stages)
+        preview_units = preview.units(history)
+
+    def render_preview_index(done):
+        render_index(output_root, **index_args,
+                     index_rows=[index_rows.get(s.type) or preview.rows[s.type] for s in stages],
+                     sa_data=sa_data or preview.sa_data, sa_link=not sa_pending,
+                     build_status=f"{done} / {len(units)} reports complete")
+
+    if preview is not None:
+        render_preview_index(0)
+        print(f"  → Preview index generated at {output_root / 'index.html'}")
+
+    done = 0
+    try:
+        for unit, success, value in run_units(preview_units + units):
+            if unit.kind == "preview":
+                preview.apply(unit, success, value)
+                render_preview_index(done)
+                continue
+            done += 1
             if success:
-                print(f"  → {rtype}_Report.html generated")
+                if unit.kind == "stage":
+                    index_rows[unit.key] = value
+                elif unit.kind == "sa_summary":
+                    sa_data = value
+                print(f"  → {UNIT_OUTPUTS[unit.kind].format(unit.key)} generated")
             else:
-                print(f"[ERROR] {rtype}: {err}", file=sys.stderr)
-
-    index_rows = [
-        build_index_cells_for_uit(rtype, list((input_root / "UT").glob("*.xml"))) if rtype == "UIT" else build_index_cells(rtype, list((input_root / rtype).glob("*.xml")))
+                print(f"[ERROR] {unit.key}: {value}", file=sys.stderr)
+                if unit.kind == "stage":
+                    index_rows[unit.key] = index_cells(stage_by_type[unit.key], [])
+            sa_pending.discard(unit.key)
+            if preview is not None:
+                if unit.kind == "stage":
+                    preview.stage_done(unit.key, success)
+                if done < len(units):
+                    render_preview_index(done)
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+        if preview is not None:
+            preview.cleanup()
+    history.save()
+
+    render_index(
+        output_root,
+        **index_args,
+        index_rows=[index_rows.get(s.type) or index_cells(s, []) for s in stages],
+        sa_data=sa_data,
+    )
+    print(f"\nIndex generated at {output_root / 'index.html'}")
+    print("All reports processed successfully.")
 
-        for rtype in REPORT_TYPES
-    ]
+def project_units(project_name, input_root: Path, output_root: Path, stages: list[Stage],
+                  history: CostHistory, row_budget: int = DEFAULT_ROW_BUDGET,
+                  memory_limit: int | None = None, debug: bool = False, tag=None,
+                  work_dir: Path | None = None) -> list[WorkUnit]:
+    """
+    프로젝트 하나의 작업 단위 목록: 단계별 보고서 + SA 요약 + SA 컴포넌트 보고서.
+    SA 요약과 컴포넌트 보고서는 서로 독립이므로 테스트 단계와 함께 병렬로 실행된다.
+    tag 는 모든 WorkUnit.tag 에 그대로 설정된다 (batch 에서 프로젝트 구분용).
+    work_dir 를 주면 XML 이 DEFAULT_CHUNK_SIZE 개를 넘는 입력 폴더는 묶음별 parse_chunk 작업으로
+    나눠 파싱하고 (UT/UIT 처럼 같은 폴더를 쓰는 단계는 공유), 결과는 work_dir 의 인코딩 파일로 전달한다.
+    """
+    units = []
+    chunk_units = {}
+    for stage in stages:
+        xmls = stage.xmls(input_root)
+        deps = []
+        if work_dir is not None and len(xmls) > DEFAULT_CHUNK_SIZE:
+            deps = chunk_units.get(stage.source)
+            if deps is None:
+                deps = chunk_units[stage.source] = [
+                    WorkUnit(f"{stage.source}#{i}", "parse_chunk", parse_to_file, (chunk, work_dir),
+                             input_size(chunk), history, tag=tag)
+                    for i, chunk in enumerate(chunk_paths(xmls))
+                ]
+        units.append(WorkUnit(
+            stage.type, "stage", _stage_unit, (project_name, stage, xmls, output_root),
+            input_size(xmls), history, tag=tag, deps=deps,
+        ))
 
-    # SA 보고서 처리
     sa_report_path = input_root / "SA" / "report.xml"
-    sa_data = {}
-
     if sa_report_path.exists():
         print(f"Processing Static Analysis report: {sa_report_path}")
-        sa_data = parse_sa_file_enhanced(sa_report_path, debug=debug_mode)
-        render_report(
-            project_name,
-            "Static Analysis",
-            [],
-            output_root / "SA_Report.html",
-            sa_xml_path=sa_report_path,
-            sa_data=sa_data,
-        )
-        print("  → SA_Report.html generated")
-
-        generate_sa_component_reports(sa_report_path, output_root)
-        print("  → SA Component detailed reports generated")
+        sa_size = input_size([sa_report_path])
+        units.append(WorkUnit(
+            "SA", "sa_summary", _sa_summary_unit, (project_name, sa_report_path, output_root, debug),
+            sa_size, history, tag=tag,
+        ))
+        units.append(WorkUnit(
+            "SA_components", "sa_components", _sa_components_unit,
+            (sa_report_path, output_root, row_budget, memory_limit),
+            sa_size, history, tag=tag,
+        ))
     else:
         print("No Static Analysis report found.")
+    return units
 
-    tpl_dir = Path(__file__).parent / "templates"
-    env = Environment(
-        loader=FileSystemLoader(str(tpl_dir)),
-        autoescape=select_autoescape(["html"])
-    )
-    tpl = env.get_template("index.html")
-    html = tpl.render(
+def index_cells(stage: Stage, xml_paths: list[Path], parsed=None) -> str:
+    """parsed 에 parse_files 결과를 넘기면 다시 파싱하지 않는다."""
+    if stage.suite_level:
+        return build_index_cells_for_uit(stage.type, xml_paths, parsed)
+    return build_index_cells(stage.type, xml_paths, parsed)
+
+def render_index(output_root: Path, project_name, branch, release_tag, commit_id, build_number,
+                 report_date, index_rows, sa_data, writer=None, build_status=None, sa_link=True):
+    """
+    build_status 가 있으면 진행 상태 표시와 자동 새로고침이 붙은 미리보기 인덱스.
+    sa_link 가 False 이면 SA 보고서 링크 대신 생성 중 표시 (아직 없는 페이지를 링크하지 않도록)
+    """
+    html = index_html(project_name, branch, release_tag, commit_id, build_number,
+                      report_date, index_rows, sa_data, build_status, sa_link)
+    write_page(output_root / "index.html", html, writer)
+
+def index_html(project_name, branch, release_tag, commit_id, build_number,
+               report_date, index_rows, sa_data, build_status=None, sa_link=True) -> str:
+    tpl = get_environment().get_template("index.html")
+    return tpl.render(
         project_name=project_name,
         branch=branch,
         release_tag=release_tag,
@@ -196,15 +308,14 @@ def main():
         index_rows=index_rows,
         sa_total_violations=f"{sa_data.get('total_violations', 0):,}" if sa_data else "0",
         sa_component_counts={k: f"{v:,}" for k, v in sa_data.get("comp_counts", {}).items()} if sa_data else {},
+        build_status=build_status,
+        sa_link=sa_link,
     )
-    (output_root / "index.html").write_text(html, encoding="utf-8")
-    print(f"\nIndex generated at {output_root / 'index.html'}")
-    print("All reports processed successfully.")
 
-def build_index_cells(report_type: str, xml_paths: list[Path]) -> str:
-    name = DISPLAY_NAMES[report_type]
+def build_index_cells(report_type: str, xml_paths: list[Path], parsed=None) -> str:
+    name = DISPLAY_NAMES.get(report_type, report_type)
     if xml_paths:
-        results, total, failures, skipped, timestamps = parse_files(xml_paths)
+        results, total, failures, skipped, timestamps = parsed or parse_files(xml_paths)
         executed = total - skipped
         successes = executed - failures
 
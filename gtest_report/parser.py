@@ -4,11 +4,22 @@
 Google Test XML 파일을 파싱하여 결과 객체(TestFileResult, TestCaseResult)로 반환
 PC Lint Plus 정적분석 XML도 파싱 가능하도록 확장
 """
-from xml.dom.minidom import parse
+from xml.dom.minidom import parse, parseString
 from xml.parsers.expat import ExpatError
+import itertools
 from datetime import datetime
 from pathlib import Path
 
+from .async_io import ReadAhead, DEFAULT_READ_AHEAD
+
+
+# 이름 없이 넘겨진 bytes / stream 입력의 기본 파일명 번호 (memory-1.xml, memory-2.xml, ...)
+_memory_names = itertools.count(1)
+
+
+def _memory_name() -> str:
+    return f"memory-{next(_memory_names)}.xml"
+
 
 class TestCaseResult:
     def __init__(self, name: str, time: float, status: str, failure_message: str = ""):
@@ -38,13 +49,25 @@ class TestFileResult:
         self.cases = cases
 
 
-def parse_file(xml_path: Path | str) -> TestFileResult:
+def parse_file(xml_path, data: bytes | None = None, name: str | None = None) -> TestFileResult:
     """
     Google Test XML 결과 파싱
+    data 가 주어지면 파일을 다시 읽지 않고 해당 내용을 파싱 (선읽기 결과 사용)
+    xml_path 로 경로 대신 bytes 나 file-like 객체를 넘길 수도 있다.
+    name 은 보고서에 표시할 파일명. 없으면 경로 / 객체의 name 속성을 쓰고,
+    그것도 없으면 (또는 "<stdin>" 처럼 태그 문자가 들어 있으면) 고유한 "memory-<n>.xml" 을 붙인다.
     """
+    if isinstance(xml_path, (bytes, bytearray)):
+        data, xml_path = xml_path, None
+    elif hasattr(xml_path, "read"):
+        data, xml_path = xml_path.read(), getattr(xml_path, "name", None)
+        if not isinstance(xml_path, (str, bytes)) or any(c in str(xml_path) for c in "<>"):
+            xml_path = None
+    if xml_path is None:
+        xml_path = name or _memory_name()
     path_str = str(xml_path)
     try:
-        dom = parse(path_str)
+        dom = parseString(data) if data is not None else parse(path_str)
     except ExpatError as e:
         raise RuntimeError(f"Failed to parse {path_str}: {e}")
 
@@ -116,7 +139,7 @@ def parse_file(xml_path: Path | str) -> TestFileResult:
         cases.append(TestCaseResult(fullname, elapsed, status, failure_message))
 
     earliest = min(timestamps) if timestamps else None
-    filename = Path(path_str).name
+    filename = name or Path(path_str).name
     return TestFileResult(
         filename=filename,
         total=len(testcases),
@@ -154,16 +177,26 @@ def parse_sa_file(xml_path: Path | str) -> dict[str, int]:
     return rule_counts
 
 
-def parse_files(xml_paths: list[Path] | list[str]):
+def parse_files(xml_paths: list[Path] | list[str], read_ahead: int = DEFAULT_READ_AHEAD):
     """
     Google Test 여러 파일 파싱 (기존 함수)
+    read_ahead > 0 이면 다음 파일들을 백그라운드 스레드로 미리 읽어 I/O 대기를 숨김
+    경로 대신 bytes / file-like 객체가 섞여 있어도 된다 (parse_file 참고)
+    """
+    if read_ahead > 0:
+        sources = ReadAhead(xml_paths, depth=read_ahead)
+    else:
+        sources = ((p, None) for p in xml_paths)
+    return summarize([parse_file(p, data) for p, data in sources])
+
+
+def summarize(results: list[TestFileResult]):
+    """
+    TestFileResult 목록을 parse_files 와 같은 (results, total, failures, skipped, timestamps) 로 집계
     """
-    results = []
     tot = fail = skip = 0
     all_ts: list[datetime] = []
-    for p in xml_paths:
-        res = parse_file(p)
-        results.append(res)
+    for res in results:
         tot += res.total
         fail += res.failures
         skip += res.skipped
@@ -0,0 +1,301 @@
+"""
+빠른 미리보기(preview) 모드
+- 헤더(<testsuites>/<testsuite>) 속성의 건수와 <failure> 검색만으로 결과를 빠르게 요약
+- 스캔은 본 작업과 같은 프로세스 풀에서 가장 먼저 실행되어 전체 보고서 생성과 겹쳐 진행
+- 단계별 실패 목록만 담은 임시 보고서(<TYPE>_Preview.html)와 진행 상태가 표시된 index.html 을 생성
+- 인덱스는 이미 만들어진 페이지만 링크하며, 단계가 완성되면 전체 보고서(<TYPE>_Report.html)로 링크를 바꾼다
+- 실행이 끝나면 임시 보고서를 지우므로 최종 결과는 일반 실행과 동일
+"""
+import io
+import re
+import sys
+import html as html_lib
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+
+from .async_io import ReadAhead, STREAM_CHUNK, write_page
+from .builder.html_builder import get_environment
+from .builder.rows import format_icon
+from .scheduler import WorkUnit, CostHistory, input_size
+
+# 단계별 임시 보고서 파일명 (전체 보고서를 쓰는 워커와 같은 파일을 건드리지 않도록 분리)
+PREVIEW_PAGE = "{}_Preview.html"
+# 본 작업보다 먼저 제출되도록 미리보기 작업에 주는 우선순위
+PREVIEW_PRIORITY = 1
+
+_ROOT_TAG = re.compile(rb"<testsuites?\b([^>]*)>")
+_ATTR = re.compile(rb'([\w:-]+)\s*=\s*"([^"]*)"')
+_SUITE_NAME = re.compile(rb'<testsuite\s[^>]*?\bname="([^"]*)"')
+_SKIPPED = re.compile(rb"<skipped\b")
+_SA_MESSAGE = re.compile(rb"<message\b")
+
+
+class QuickResult:
+    """
+    XML 하나의 빠른 요약 (헤더 건수 + Test Suite 이름 + 실패 케이스 목록).
+    error 는 <failure> 파싱에 실패한 경우의 메시지 (건수는 헤더 값만 사용)
+    """
+
+    def __init__(self, filename: str, total: int, failures: int, skipped: int,
+                 timestamp: datetime | None, suites: set[str], failed: list[tuple[str, str]],
+                 error: str | None = None):
+        self.filename = filename
+        self.total = total
+        self.failures = failures
+        self.skipped = skipped
+        self.timestamp = timestamp
+        self.suites = suites
+        self.failed = failed
+        self.error = error
+
+
+def _header_attrs(data: bytes) -> dict[str, str]:
+    m = _ROOT_TAG.search(data)
+    if not m:
+        return {}
+    return {k.decode(): v.decode("utf-8", "replace") for k, v in _ATTR.findall(m.group(1))}
+
+
+def _int(value) -> int:
+    try:
+        return int(value or 0)
+    except ValueError:
+        return 0
+
+
+def _timestamp(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    if value.endswith("Z"):
+        value = value[:-1]
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return None
+
+
+def _failed_cases(data: bytes) -> list[tuple[str, str]]:
+    failed = []
+    for _, elem in ET.iterparse(io.BytesIO(data)):
+        if elem.tag != "testcase":
+            continue
+        node = elem.find("failure")
+        if node is not None:
+            name = f"{elem.get('classname', '')}.{elem.get('name', '')}"
+            message = ((node.get("message") or "") + "\n" + (node.text or "")).strip()
+            failed.append((name, message))
+        elem.clear()
+    return failed
+
+
+def scan_file(xml_path: Path, data: bytes | None = None) -> QuickResult:
+    """
+    헤더 속성으로 건수를 읽고, <failure> 가 있는 파일만 파싱해 실패 케이스를 모은다.
+    Skip 건수는 헤더 값과 <skipped> 태그 수 중 큰 값을 쓴다.
+    파싱에 실패하면 실패 목록 없이 헤더 건수만 담고 error 를 기록한다.
+    """
+    if data is None:
+        data = Path(xml_path).read_bytes()
+    attrs = _header_attrs(data)
+    failed = []
+    error = None
+    if b"<failure" in data:
+        try:
+            failed = _failed_cases(data)
+        except ET.ParseError as e:
+            failed = []
+            error = f"Failed to parse {Path(xml_path).name}: {e}"
+    return QuickResult(
+        filename=Path(xml_path).name,
+        total=_int(attrs.get("tests")),
+        failures=max(_int(attrs.get("failures")), len(failed)),
+        skipped=max(_int(attrs.get("skipped")) + _int(attrs.get("disabled")), len(_SKIPPED.findall(data))),
+        timestamp=_timestamp(attrs.get("timestamp")),
+        suites={html_lib.unescape(n.decode("utf-8", "replace")) for n in _SUITE_NAME.findall(data)},
+        failed=failed,
+        error=error,
+    )
+
+
+def scan_files(xml_paths) -> list[QuickResult]:
+    return [scan_file(p, data) for p, data in ReadAhead(xml_paths)]
+
+
+def count_sa_violations(report_xml_path: Path, chunk_size: int = STREAM_CHUNK) -> int:
+    """
+    report.xml 의 <message> 개수만 센다 (컴포넌트별 집계 없음).
+    chunk_size 단위로 읽으므로 파일 크기와 무관하게 메모리 사용량이 일정하다.
+    """
+    count = 0
+    tail = b""
+    # 태그 뒤 한 글자까지 있어야 \b 를 판단할 수 있으므로 끝 len("<message") 바이트는 다음 청크로 넘긴다
+    keep = len(b"<message")
+    with open(report_xml_path, "rb") as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                break
+            buf = tail + chunk
+            cut = max(len(buf) - keep, 0)
+            count += sum(1 for m in _SA_MESSAGE.finditer(buf) if m.start() < cut)
+            tail = buf[cut:]
+    return count + len(_SA_MESSAGE.findall(tail))
+
+
+def preview_index_cells(stage, quick: list[QuickResult]) -> str:
+    """
+    미리보기용 인덱스 셀 (헤더 건수 기준, Skip 사유별 건수는 "-").
+    suite_level 단계는 Test Suite 이름 수와 실패 케이스가 있는 Suite 수로 센다.
+    """
+    if not quick:
+        return "".join(f"<td>{c}</td>" for c in [stage.name] + ["NT"] * 8)
+    if stage.suite_level:
+        total = len(set().union(*(q.suites for q in quick)))
+        failures = len({name.partition(".")[0] for q in quick for name, _ in q.failed})
+        executed = total
+    else:
+        total = sum(q.total for q in quick)
+        failures = sum(q.failures for q in quick)
+        executed = total - sum(q.skipped for q in quick)
+    timestamps = [q.timestamp for q in quick if q.timestamp]
+    ts_str = min(timestamps).strftime("%Y-%m-%d %H:%M:%S") if timestamps else ""
+    fail_html = f'<span style="color:red;">{failures:,}</span>' if failures else "0"
+    cells = [
+        stage.name,
+        f"{total:,}",
+        f"{executed:,}",
+        f"{executed - failures:,}",
+        fail_html,
+        "-",
+        "-",
+        ts_str,
+        f'<a href="{PREVIEW_PAGE.format(stage.type)}">Preview</a>',
+    ]
+    return "".join(f"<td>{c}</td>" for c in cells)
+
+
+def render_preview_report(project_name: str, stage, quick: list[QuickResult], output_path: Path):
+    """단계별 실패 목록만 담은 임시 보고서"""
+    failed_rows = []
+    failed_suites = []
+    for q in quick:
+        for name, message in q.failed:
+            suite, _, case_name = name.partition(".")
+            if stage.suite_level:
+                if suite not in failed_suites:
+                    failed_suites.append(suite)
+                continue
+            failed_rows.append(
+                f"<tr><td>{html_lib.escape(suite)}</td><td>{html_lib.escape(case_name)}</td><td>{format_icon('failed')}</td>"
+                f"<td>{html_lib.escape(message)}</td></tr>"
+            )
+    if stage.suite_level:
+        failed_rows = [
+            f"<tr><td>{html_lib.escape(s)}</td><td>{format_icon('failed')}</td></tr>" for s in failed_suites
+        ]
+
+    tpl = get_environment().get_template("preview_report.html")
+    html = tpl.render(
+        title=f"{project_name} {stage.name}",
+        suite_level=stage.suite_level,
+        total_files=len(quick),
+        total_tests=f"{sum(q.total for q in quick):,}",
+        failed_rows=failed_rows,
+        scan_errors=[q.error for q in quick if q.error],
+    )
+    write_page(output_path, html)
+
+
+def _placeholder_cells(stage, label: str) -> str:
+    return "".join(f"<td>{c}</td>" for c in [stage.name] + ["-"] * 7 + [label])
+
+
+def _redirect_page(target: str) -> str:
+    # 임시 보고서를 열어 둔 브라우저가 다음 새로고침 때 전체 보고서로 이동하도록
+    return (f'<!DOCTYPE html>\n<html><head><meta charset="UTF-8">'
+            f'<meta http-equiv="refresh" content="0; url={target}"></head>'
+            f'<body><a href="{target}">{target}</a></body></html>\n')
+
+
+class PreviewRun:
+    """
+    --preview 실행 상태.
+    units() 의 스캔 작업 결과를 apply() 로 받아 임시 보고서와 인덱스 셀을 만들고,
+    단계가 완성되면 stage_done() 으로 임시 보고서를 전체 보고서로의 이동 페이지로 바꾼다.
+    XML 이 없는 단계는 "NT", 스캔 전은 "Pending", 스캔에 실패한 단계는 "Preview failed" 셀(링크 없음).
+    """
+
+    def __init__(self, project_name: str, input_root: Path, output_root: Path, stages):
+        self.project_name = project_name
+        self.input_root = input_root
+        self.output_root = output_root
+        self.stages = stages
+        self.xmls = {stage.type: stage.xmls(input_root) for stage in stages}
+        self.rows = {
+            stage.type: _placeholder_cells(stage, "Pending") if self.xmls[stage.type]
+            else preview_index_cells(stage, [])
+            for stage in stages
+        }
+        self.sa_data = {}
+        self.done = set()
+        self.pages = []
+
+    def units(self, history: CostHistory | None = None, tag=None) -> list[WorkUnit]:
+        """입력 폴더(source)마다 하나의 스캔 작업 (UT/UIT 공유) + SA 위반 수 세기"""
+        units = []
+        seen = set()
+        for stage in self.stages:
+            xmls = self.xmls[stage.type]
+            if not xmls or stage.source in seen:
+                continue
+            seen.add(stage.source)
+            units.append(WorkUnit(f"preview:{stage.source}", "preview", scan_files, (xmls,),
+                                  input_size(xmls), history, tag=tag, priority=PREVIEW_PRIORITY))
+        sa_report_path = self.input_root / "SA" / "report.xml"
+        if sa_report_path.exists():
+            units.append(WorkUnit("preview:SA", "preview", count_sa_violations, (sa_report_path,),
+                                  input_size([sa_report_path]), history, tag=tag, priority=PREVIEW_PRIORITY))
+        return units
+
+    def apply(self, unit: WorkUnit, success: bool, value):
+        """스캔 작업 결과 반영. 이미 완성된 단계는 건드리지 않는다."""
+        source = unit.key[len("preview:"):]
+        if source == "SA":  # SA 폴더는 단계로 쓰이지 않는다 (RESERVED_FOLDERS)
+            if success:
+                self.sa_data = {"total_violations": value}
+            else:
+                print(f"[WARN] preview SA: {value}", file=sys.stderr)
+            return
+        for stage in self.stages:
+            if stage.source != source or stage.type in self.done:
+                continue
+            if not success:
+                print(f"[WARN] preview {stage.type}: {value}", file=sys.stderr)
+                self.rows[stage.type] = _placeholder_cells(stage, "Preview failed")
+                continue
+            if stage.source == stage.type:
+                for q in value:
+                    if q.error:
+                        print(f"[WARN] preview {stage.type}: {q.error}", file=sys.stderr)
+            path = self.output_root / PREVIEW_PAGE.format(stage.type)
+            try:
+                render_preview_report(self.project_name, stage, value, path)
+            except Exception as e:
+                print(f"[WARN] preview {stage.type}: {e}", file=sys.stderr)
+                self.rows[stage.type] = _placeholder_cells(stage, "Preview failed")
+                continue
+            self.pages.append(path)
+            self.rows[stage.type] = preview_index_cells(stage, value)
+
+    def stage_done(self, stage_type: str, success: bool):
+        """단계 작업이 끝나면 임시 보고서를 전체 보고서(실패 시 인덱스)로의 이동 페이지로 교체"""
+        self.done.add(stage_type)
+        path = self.output_root / PREVIEW_PAGE.format(stage_type)
+        if path in self.pages:
+            write_page(path, _redirect_page(f"{stage_type}_Report.html" if success else "index.html"))
+
+    def cleanup(self):
+        for path in self.pages:
+            path.unlink(missing_ok=True)
+        self.pages.clear()
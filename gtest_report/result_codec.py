@@ -0,0 +1,269 @@
+"""
+TestFileResult 목록의 압축 바이너리 인코딩 (워커 → 부모 프로세스 전달용)
+
+레이아웃 (little-endian, 각 구역은 8바이트 정렬):
+  header   : magic "GTRC", version, 파일 수, 케이스 수, 문자열 수, 상태 수
+  strings  : offsets(u64 × (n+1)) + UTF-8 blob  — 모든 문자열은 이 테이블의 인덱스로 참조
+  statuses : 상태 문자열 인덱스(u32 열) — success/failed/skipped 외의 상태("passed" 등)도 그대로 보존
+  files    : name, timestamp(ISO, "" = 없음), total, failures, skipped (u32 열),
+             duration(f64 열), case_start(u32 × (n+1))
+  cases    : name, message (u32 열), time(f64 열), status(u16 열, statuses 의 인덱스)
+
+워커는 결과를 임시 파일에 쓰고 경로만 반환하며,
+부모는 mmap 으로 열어 열(column) 단위로 집계하고 TestCaseResult 는 필요할 때만 만든다.
+"""
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import weakref
+from array import array
+from datetime import datetime
+
+from .parser import TestCaseResult, TestFileResult, parse_file
+
+MAGIC = b"GTRC"
+VERSION = 2
+_HEADER = struct.Struct("<4sIIIII")
+
+# 워커 하나가 한 번에 파싱해 인코딩 파일로 넘기는 XML 수
+DEFAULT_CHUNK_SIZE = 32
+
+# 상태 테이블의 앞부분 (그 외 상태는 처음 나온 순서로 뒤에 추가)
+STATUS_NAMES = ("success", "failed", "skipped")
+
+
+def _pad(buf: bytearray):
+    buf.extend(b"\0" * (-len(buf) % 8))
+
+
+class _StringTable:
+    def __init__(self):
+        self.index = {}
+        self.blobs = []
+
+    def add(self, s: str) -> int:
+        i = self.index.get(s)
+        if i is None:
+            i = self.index[s] = len(self.blobs)
+            self.blobs.append(s.encode("utf-8"))
+        return i
+
+
+def encode_results(results: list[TestFileResult]) -> bytes:
+    strings = _StringTable()
+    f_name, f_ts, f_total, f_fail, f_skip = (array("I") for _ in range(5))
+    f_dur = array("d")
+    f_start = array("I", [0])
+    c_name, c_msg = array("I"), array("I")
+    c_time = array("d")
+    c_status = array("H")
+    status_codes = {name: i for i, name in enumerate(STATUS_NAMES)}
+
+    for fr in results:
+        f_name.append(strings.add(fr.filename))
+        f_ts.append(strings.add(fr.timestamp.isoformat() if fr.timestamp else ""))
+        f_total.append(fr.total)
+        f_fail.append(fr.failures)
+        f_skip.append(fr.skipped)
+        f_dur.append(fr.duration)
+        for case in fr.cases:
+            c_name.append(strings.add(case.name))
+            c_msg.append(strings.add(case.failure_message or ""))
+            c_time.append(case.time)
+            code = status_codes.get(case.status)
+            if code is None:
+                code = status_codes[case.status] = len(status_codes)
+            c_status.append(code)
+        f_start.append(len(c_name))
+
+    statuses = array("I", [strings.add(name) for name in status_codes])
+    offsets = array("Q", [0])
+    for b in strings.blobs:
+        offsets.append(offsets[-1] + len(b))
+
+    buf = bytearray(_HEADER.pack(MAGIC, VERSION, len(results), len(c_name), len(strings.blobs), len(statuses)))
+    _pad(buf)
+    for section in (offsets, b"".join(strings.blobs), statuses, f_name, f_ts, f_total, f_fail, f_skip,
+                    f_dur, f_start, c_name, c_msg, c_time, c_status):
+        buf.extend(section if isinstance(section, (bytes, bytearray)) else section.tobytes())
+        _pad(buf)
+    return bytes(buf)
+
+
+def write_results(results: list[TestFileResult], path=None, directory=None) -> str:
+    """인코딩 결과를 파일로 기록하고 경로 반환 (path 가 없으면 directory 안의 임시 파일)"""
+    data = encode_results(results)
+    if path is None:
+        fd, path = tempfile.mkstemp(prefix="gtest_report_", suffix=".gtrc", dir=directory)
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+    else:
+        with open(path, "wb") as f:
+            f.write(data)
+    return str(path)
+
+
+def parse_to_file(xml_paths, directory=None) -> str:
+    """워커용: XML 묶음을 파싱해 인코딩 파일 경로만 반환 (pickle 비용 최소화)"""
+    return write_results([parse_file(p) for p in xml_paths], directory=directory)
+
+
+class ResultsView:
+    """
+    인코딩된 결과의 읽기 전용 뷰.
+    bytes 또는 파일 경로를 받으며, 파일은 mmap 으로 열고 delete=True 면 뷰 해제 시 삭제한다.
+    해제는 close() 또는 뷰(와 뷰를 참조하는 LazyTestFileResult)가 모두 사라질 때 일어나며,
+    mmap 을 닫은 뒤 삭제하므로 Windows 에서도 파일이 남지 않는다.
+    """
+
+    def __init__(self, source, delete: bool = False):
+        # mmap 을 참조하는 memoryview 목록. mmap 을 닫기 전에 모두 release 해야 한다
+        self._views = []
+        if isinstance(source, (bytes, bytearray)):
+            self._buf = memoryview(source)
+        else:
+            path = str(source)
+            with open(path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._buf = memoryview(mm)
+            self._finalizer = weakref.finalize(self, _release, mm, self._views, path if delete else None)
+        self._views.append(self._buf)
+
+        magic, version, n_files, n_cases, n_strings, n_statuses = _HEADER.unpack_from(self._buf, 0)
+        if magic != MAGIC or version != VERSION:
+            raise RuntimeError("Unsupported result encoding")
+        self.n_files = n_files
+        self.n_cases = n_cases
+
+        pos = _HEADER.size + (-_HEADER.size % 8)
+
+        def take(fmt, count, itemsize):
+            nonlocal pos
+            view = self._buf[pos:pos + count * itemsize].cast(fmt)
+            pos += count * itemsize
+            pos += -pos % 8
+            self._views.append(view)
+            return view
+
+        self._str_off = take("Q", n_strings + 1, 8)
+        blob_len = self._str_off[-1] if n_strings else 0
+        self._str_blob = self._buf[pos:pos + blob_len]
+        self._views.append(self._str_blob)
+        pos += blob_len
+        pos += -pos % 8
+        self._statuses = [self._str(i) for i in take("I", n_statuses, 4)]
+        self._f_name = take("I", n_files, 4)
+        self._f_ts = take("I", n_files, 4)
+        self._f_total = take("I", n_files, 4)
+        self._f_fail = take("I", n_files, 4)
+        self._f_skip = take("I", n_files, 4)
+        self._f_dur = take("d", n_files, 8)
+        self._f_start = take("I", n_files + 1, 4)
+        self._c_name = take("I", n_cases, 4)
+        self._c_msg = take("I", n_cases, 4)
+        self._c_time = take("d", n_cases, 8)
+        self._c_status = take("H", n_cases, 2)
+
+    def _str(self, i: int) -> str:
+        return bytes(self._str_blob[self._str_off[i]:self._str_off[i + 1]]).decode("utf-8")
+
+    # --- 열 단위 집계 (객체 생성 없음) ---
+    def totals(self):
+        """parse_files 와 같은 (total, failures, skipped, timestamps) 집계"""
+        timestamps = []
+        for i in range(self.n_files):
+            ts = self._str(self._f_ts[i])
+            if ts:
+                timestamps.append(datetime.fromisoformat(ts))
+        return sum(self._f_total), sum(self._f_fail), sum(self._f_skip), timestamps
+
+    # --- 필요 시 객체 생성 ---
+    def cases(self, i: int) -> list[TestCaseResult]:
+        return [
+            TestCaseResult(self._str(self._c_name[j]), self._c_time[j],
+                           self._statuses[self._c_status[j]], self._str(self._c_msg[j]))
+            for j in range(self._f_start[i], self._f_start[i + 1])
+        ]
+
+    def lazy_results(self) -> list[TestFileResult]:
+        """케이스 목록(cases)을 처음 접근할 때 만드는 TestFileResult 목록"""
+        return [LazyTestFileResult(self, i) for i in range(self.n_files)]
+
+    def close(self):
+        """mmap 해제 (delete=True 였다면 파일 삭제). 이후 뷰를 사용할 수 없다."""
+        finalizer = getattr(self, "_finalizer", None)
+        if finalizer is not None:
+            finalizer()
+
+
+class LazyTestFileResult(TestFileResult):
+    """
+    요약 필드는 바로 채우고, cases 는 처음 접근할 때 ResultsView 에서 디코딩.
+    뷰를 참조하므로 cases 를 읽기 전까지 mmap 이 유지된다.
+    """
+
+    def __init__(self, view: ResultsView, i: int):
+        ts = view._str(view._f_ts[i])
+        self._view = view
+        self._index = i
+        super().__init__(
+            filename=view._str(view._f_name[i]),
+            total=view._f_total[i],
+            failures=view._f_fail[i],
+            skipped=view._f_skip[i],
+            duration=view._f_dur[i],
+            timestamp=datetime.fromisoformat(ts) if ts else None,
+            cases=None,
+        )
+
+    @property
+    def cases(self) -> list[TestCaseResult]:
+        if self._cases is None:
+            self._cases = self._view.cases(self._index)
+            self._view = None
+        return self._cases
+
+    @cases.setter
+    def cases(self, value):
+        self._cases = value
+
+
+def chunk_paths(xml_paths, chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[list]:
+    xml_paths = list(xml_paths)
+    return [xml_paths[i:i + chunk_size] for i in range(0, len(xml_paths), chunk_size)]
+
+
+def load_encoded(paths, delete: bool = False):
+    """
+    인코딩 파일 목록을 parse_files 와 같은 (results, total, failures, skipped, timestamps) 로 연다.
+    results 의 cases 는 보고서가 실제로 읽을 때만 만들어진다.
+    """
+    results = []
+    tot = fail = skip = 0
+    all_ts: list[datetime] = []
+    for path in paths:
+        view = ResultsView(path, delete=delete)
+        t, f, s, ts = view.totals()
+        tot += t
+        fail += f
+        skip += s
+        all_ts.extend(ts)
+        results.extend(view.lazy_results())
+    return results, tot, fail, skip, all_ts
+
+
+def _release(mm, views, path):
+    # 하위 뷰를 먼저 놓아야 mmap 을 닫을 수 있고, Windows 는 닫힌 파일만 삭제할 수 있다
+    for view in reversed(views):
+        view.release()
+    views.clear()
+    mm.close()
+    if path is not None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            print(f"[WARN] could not remove temporary result file {path}: {e}", file=sys.stderr)
@@ -1,26 +1,123 @@
 from collections import defaultdict
-from xml.dom.minidom import parse
+from contextlib import nullcontext
 from pathlib import Path
 import re
 
-def generate_sa_component_reports(report_xml_path: Path, output_dir: Path):
+from .async_io import BackgroundWriter
+from .builder.chart_builder import build_ranked_series
+from .builder.html_builder import get_environment
+from .sa_spill import ViolationStore
+from .sa_summary_parser import iter_sa_violations
+
+# 컴포넌트 페이지 하나에 출력할 상세 행(그룹 행 + 펼침 라인 행) 최대 개수
+DEFAULT_ROW_BUDGET = 10000
+# 그룹 요약 셀에 나열할 라인 번호 최대 개수
+MAX_SUMMARY_LINES = 50
+
+
+def group_violation_records(open_records, row_budget: int = DEFAULT_ROW_BUDGET):
+    """
+    (파일, Rule ID, Severity) 단위로 묶어 건수/라인 목록을 집계.
+    파일 섹션(제목 1행)과 그룹 행을 먼저 예산에 배정하고, 남은 예산만큼 라인별 상세 행을 채운다.
+    예산을 넘는 파일/그룹/라인은 출력하지 않고 생략 건수만 기록한다.
+    (파일 목록, 생략된 파일 수, 생략된 파일의 위반 수) 를 반환.
+
+    open_records 는 (file_path, violation) 이터레이터를 새로 여는 함수이며 두 번 호출된다.
+    1차 순회에서 집계, 2차 순회에서 예산 안의 상세 행만 모으므로
+    위반 전체를 메모리에 올리지 않는다.
+    """
+    files = {}
+    for fname, v in open_records():
+        entry = files.get(fname)
+        if entry is None:
+            entry = files[fname] = {"file": fname, "total": 0, "grouped": {}, "hidden_groups": 0}
+        entry["total"] += 1
+        key = (v["ruleid"], v["severity"])
+        g = entry["grouped"].get(key)
+        if g is None:
+            g = entry["grouped"][key] = {
+                "ruleid": v["ruleid"],
+                "severity": v["severity"],
+                "desc": v["desc"],
+                "count": 0,
+                "summary_lines": [],
+            }
+        g["count"] += 1
+        if len(g["summary_lines"]) < MAX_SUMMARY_LINES:
+            g["summary_lines"].append(v["line"])
+
+    remaining = row_budget
+    shown_files = []
+    hidden_files = hidden_violations = 0
+    for entry in files.values():
+        # 제목과 그룹 행 하나도 못 넣는 파일부터는 섹션 자체를 생략
+        if remaining < 2:
+            hidden_files += 1
+            hidden_violations += entry["total"]
+            continue
+        remaining -= 1
+        groups = sorted(entry.pop("grouped").values(), key=lambda g: (-g["count"], g["ruleid"]))
+        if remaining < len(groups):
+            entry["hidden_groups"] = len(groups) - remaining
+            groups = groups[:remaining]
+        entry["groups"] = groups
+        remaining -= len(groups)
+        shown_files.append(entry)
+
+    quotas = {}
+    for entry in shown_files:
+        for g in entry["groups"]:
+            lines = g.pop("summary_lines")
+            g["lines"] = ", ".join(lines)
+            g["more_lines"] = g["count"] - len(lines)
+            shown = min(g["count"], max(remaining, 0))
+            g["details"] = []
+            g["hidden_details"] = g["count"] - shown
+            remaining -= shown
+            if shown:
+                quotas[(entry["file"], g["ruleid"], g["severity"])] = (g["details"], shown)
+
+    if quotas:
+        for fname, v in open_records():
+            q = quotas.get((fname, v["ruleid"], v["severity"]))
+            if q is not None and len(q[0]) < q[1]:
+                q[0].append(v)
+
+    return shown_files, hidden_files, hidden_violations
+
+
+def generate_sa_component_reports(report_xml_path, output_dir: Path,
+                                  row_budget: int = DEFAULT_ROW_BUDGET,
+                                  writer: BackgroundWriter | None = None,
+                                  memory_limit: int | None = None):
+    """
+    컴포넌트별 SA_Report_<component>.html 생성.
+    memory_limit(바이트)을 주면 위반 목록이 예산을 넘을 때 임시 파일로 내보내고,
+    렌더링 시 컴포넌트 하나씩 다시 읽어 최대 메모리 사용량을 제한한다.
+    report_xml_path 는 경로, bytes, file-like 객체 모두 가능.
+    """
+    with ViolationStore(memory_limit) as store:
+        components = collect_components(report_xml_path, store)
+        _render_all(components, store, output_dir, row_budget, writer)
+
+
+def collect_components(report_xml_path, store: ViolationStore):
+    """
+    report.xml 을 한 번 읽어 컴포넌트별 집계를 반환하고, 위반 레코드는 store 에 저장.
+    first_seen 에는 Severity / Rule ID 가 전체 report 에서 처음 나온 위치를 기록한다
+    (summarize_components 가 parse_sa_file_enhanced 와 같은 순서로 합치는 데 사용).
+    """
     ruleid_pattern = re.compile(r"\[AUTOSAR Rule ([^\]]+)\]")
-    dom = parse(str(report_xml_path))
-    messages = dom.getElementsByTagName("message")
 
     components = defaultdict(lambda: {
         "violations": 0,
         "severity_counts": defaultdict(int),
         "ruleid_counts": defaultdict(int),
         "file_counts": defaultdict(int),
-        "file_violations": defaultdict(list),
+        "first_seen": {},
     })
 
-    for msg in messages:
-        file_node = msg.getElementsByTagName("file")
-        if not file_node or file_node[0].firstChild is None:
-            continue
-        file_path = file_node[0].firstChild.nodeValue.strip()
+    for index, (file_path, severity, desc_text, line) in enumerate(iter_sa_violations(report_xml_path)):
         parts = Path(file_path).parts
         component = "etc"
         try:
@@ -30,49 +127,83 @@ def generate_sa_component_reports(report_xml_path: Path, output_dir: Path):
         except ValueError:
             pass
 
-        type_node = msg.getElementsByTagName("type")
-        severity = type_node[0].firstChild.nodeValue.strip() if type_node and type_node[0].firstChild else "Unknown"
-
-        desc_node = msg.getElementsByTagName("desc")
         ruleid = "etc"
-        desc_text = desc_node[0].firstChild.nodeValue.strip() if desc_node and desc_node[0].firstChild else ""
         m = ruleid_pattern.search(desc_text)
         if m:
             ruleid = m.group(1)
 
-        line_node = msg.getElementsByTagName("line")
-        line = line_node[0].firstChild.nodeValue.strip() if line_node and line_node[0].firstChild else ""
-
         violation_text = desc_text
 
         comp_data = components[component]
         comp_data["violations"] += 1
+        first_seen = comp_data["first_seen"]
+        first_seen.setdefault(("severity", severity), index)
+        first_seen.setdefault(("ruleid", ruleid), index)
         comp_data["severity_counts"][severity] += 1
         comp_data["ruleid_counts"][ruleid] += 1
         comp_data["file_counts"][file_path] += 1
-        comp_data["file_violations"][file_path].append({
-            "line": line,
-            "ruleid": ruleid,
-            "severity": severity,
-            "desc": violation_text,
-        })
-
-    from jinja2 import Environment, FileSystemLoader, select_autoescape
-    tpl_dir = Path(__file__).parent / "templates"
-    env = Environment(
-        loader=FileSystemLoader(str(tpl_dir)),
-        autoescape=select_autoescape(["html"]),
+        store.add(component, file_path, line, ruleid, severity, violation_text)
+
+    return components
+
+
+def summarize_components(components) -> dict:
+    """
+    collect_components 결과로 parse_sa_file_enhanced 와 같은 형태의 전체 집계를 만든다
+    (report.xml 을 다시 읽지 않음). Severity / Rule ID 는 report 전체에서 처음 나온 순서를 따른다.
+    """
+    first = {}
+    for data in components.values():
+        for key, index in data["first_seen"].items():
+            if key not in first or index < first[key]:
+                first[key] = index
+    severity_counts = {}
+    ruleid_counts = {}
+    for kind, key in sorted(first, key=first.get):
+        (severity_counts if kind == "severity" else ruleid_counts)[key] = 0
+    for data in components.values():
+        for k, v in data["severity_counts"].items():
+            severity_counts[k] += v
+        for k, v in data["ruleid_counts"].items():
+            ruleid_counts[k] += v
+    comp_files_count = {comp: len(data["file_counts"]) for comp, data in components.items()}
+    comp_counts = {comp: data["violations"] for comp, data in components.items()}
+    return {
+        "total_components": len(comp_counts),
+        "total_files": sum(comp_files_count.values()),
+        "comp_files_count": comp_files_count,
+        "total_violations": sum(comp_counts.values()),
+        "comp_counts": comp_counts,
+        "severity_counts": severity_counts,
+        "ruleid_counts": ruleid_counts,
+    }
+
+
+def render_component(comp: str, data: dict, store: ViolationStore,
+                     row_budget: int = DEFAULT_ROW_BUDGET) -> str:
+    """collect_components 결과 중 컴포넌트 하나의 SA_Report_<component>.html 렌더링"""
+    template = get_environment().get_template("sa_component_report.html")
+    file_groups, hidden_files, hidden_violations = group_violation_records(
+        lambda: store.records(comp), row_budget
     )
-    template = env.get_template("sa_component_report.html")
-
-    for comp, data in components.items():
-        output_file = output_dir / f"SA_Report_{comp}.html"
-        html = template.render(
-            component=comp,
-            total_violations=f"{data['violations']:,}",
-            severity_counts={k: f"{v:,}" for k, v in data["severity_counts"].items()},
-            ruleid_counts={k: f"{v:,}" for k, v in data["ruleid_counts"].items()},
-            file_counts={k: f"{v:,}" for k, v in data["file_counts"].items()},
-            file_violations=data["file_violations"],
-        )
-        output_file.write_text(html, encoding="utf-8")
+    return template.render(
+        component=comp,
+        total_violations=f"{data['violations']:,}",
+        severity_counts={k: f"{v:,}" for k, v in data["severity_counts"].items()},
+        ruleid_rank=build_ranked_series(data["ruleid_counts"]),
+        file_rank=build_ranked_series(data["file_counts"]),
+        file_anchors={fname: i for i, fname in enumerate(data["file_counts"], 1)},
+        file_groups=file_groups,
+        hidden_files=hidden_files,
+        hidden_violations=hidden_violations,
+    )
+
+
+def _render_all(components, store: ViolationStore, output_dir: Path, row_budget: int,
+                writer: BackgroundWriter | None):
+    # 다음 컴포넌트를 렌더링하는 동안 이전 페이지를 백그라운드로 기록
+    with BackgroundWriter() if writer is None else nullcontext(writer) as writer:
+        for comp, data in components.items():
+            writer.submit(output_dir / f"SA_Report_{comp}.html",
+                          render_component(comp, data, store, row_budget))
+            store.drop(comp)
@@ -0,0 +1,102 @@
+"""
+정적분석 위반 목록 저장소
+- 메모리 예산(memory_limit)을 넘으면 컴포넌트별 위반 목록을 임시 파일로 내보냄(spill)
+- 렌더링 시 컴포넌트 하나씩 디스크 → 메모리 순서로 다시 읽어 스트리밍
+"""
+import pickle
+import shutil
+import sys
+import tempfile
+from collections import defaultdict
+from pathlib import Path
+
+# 위반 1건당 문자열 외 부가 메모리 추정치 (tuple/dict/list 슬롯)
+_RECORD_OVERHEAD = 300
+
+
+def _record_size(record: tuple) -> int:
+    return _RECORD_OVERHEAD + sum(sys.getsizeof(s) for s in record)
+
+
+class ViolationStore:
+    """
+    컴포넌트별 (file_path, line, ruleid, severity, desc) 레코드 저장소.
+    memory_limit(바이트)이 None 이면 모두 메모리에 보관한다.
+    """
+
+    def __init__(self, memory_limit: int | None = None):
+        self.memory_limit = memory_limit
+        self._pending = defaultdict(list)
+        self._pending_bytes = 0
+        self._spill_dir = None
+        self._spilled = {}
+
+    def add(self, component: str, file_path: str, line: str, ruleid: str, severity: str, desc: str):
+        record = (file_path, line, ruleid, severity, desc)
+        self._pending[component].append(record)
+        if self.memory_limit is not None:
+            self._pending_bytes += _record_size(record)
+            if self._pending_bytes > self.memory_limit:
+                self.spill()
+
+    def spill(self):
+        """메모리에 쌓인 레코드를 컴포넌트별 임시 파일 끝에 덧붙이고 비운다."""
+        if self._spill_dir is None:
+            self._spill_dir = Path(tempfile.mkdtemp(prefix="gtest_report_sa_"))
+        for component, records in self._pending.items():
+            path = self._spilled.get(component)
+            if path is None:
+                path = self._spilled[component] = self._spill_dir / f"{len(self._spilled)}.pkl"
+            with open(path, "ab") as f:
+                pickle.dump(records, f, protocol=pickle.HIGHEST_PROTOCOL)
+        self._pending.clear()
+        self._pending_bytes = 0
+
+    @property
+    def spilled(self) -> bool:
+        return bool(self._spilled)
+
+    def records(self, component: str):
+        """
+        컴포넌트의 레코드를 추가된 순서대로 (file_path, violation dict) 로 반환.
+        디스크에 내보낸 묶음을 먼저, 메모리에 남은 레코드를 나중에 읽는다.
+        """
+        path = self._spilled.get(component)
+        if path is not None:
+            with open(path, "rb") as f:
+                while True:
+                    try:
+                        batch = pickle.load(f)
+                    except EOFError:
+                        break
+                    for record in batch:
+                        yield record[0], _as_violation(record)
+        for record in self._pending.get(component, ()):
+            yield record[0], _as_violation(record)
+
+    def drop(self, component: str):
+        """렌더링이 끝난 컴포넌트의 레코드를 해제."""
+        records = self._pending.pop(component, None)
+        if records is not None and self.memory_limit is not None:
+            self._pending_bytes -= sum(_record_size(r) for r in records)
+        path = self._spilled.pop(component, None)
+        if path is not None:
+            path.unlink(missing_ok=True)
+
+    def close(self):
+        self._pending.clear()
+        self._spilled.clear()
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def _as_violation(record: tuple) -> dict:
+    _, line, ruleid, severity, desc = record
+    return {"line": line, "ruleid": ruleid, "severity": severity, "desc": desc}
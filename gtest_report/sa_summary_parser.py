@@ -1,12 +1,52 @@
-from xml.dom.minidom import parse
+import io
+import xml.etree.ElementTree as ET
 from collections import defaultdict
 from pathlib import Path
 import re
 
-def parse_sa_file_enhanced(report_xml_path: Path, debug: bool = False):
-    dom = parse(str(report_xml_path))
-    messages = dom.getElementsByTagName("message")
+def _text(msg, tag: str):
+    node = msg.find(f".//{tag}")
+    if node is None or not node.text:
+        return None
+    return node.text.strip()
 
+def iter_sa_violations(report_xml_path):
+    """
+    report.xml 의 <message> 를 하나씩 (file_path, severity, desc, line) 으로 반환.
+    iterparse 로 처리한 요소는 즉시 트리에서 제거하므로 report.xml 크기와 무관하게
+    메모리 사용량이 일정하다. <file> 이 없는 메시지는 건너뜀.
+    report_xml_path 는 경로, bytes, file-like 객체 모두 가능.
+    """
+    if isinstance(report_xml_path, (bytes, bytearray)):
+        source = io.BytesIO(report_xml_path)
+    elif hasattr(report_xml_path, "read"):
+        source = report_xml_path
+    else:
+        source = str(report_xml_path)
+    stack = []
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            stack.append(elem)
+            continue
+        stack.pop()
+        if elem.tag != "message":
+            continue
+        file_path = _text(elem, "file")
+        if file_path is not None:
+            severity = _text(elem, "type")
+            desc_text = _text(elem, "desc")
+            line = _text(elem, "line")
+            yield (
+                file_path,
+                "Unknown" if severity is None else severity,
+                "" if desc_text is None else desc_text,
+                "" if line is None else line,
+            )
+        if stack:
+            stack[-1].remove(elem)
+
+def parse_sa_file_enhanced(report_xml_path, debug: bool = False):
+    """report_xml_path 는 경로, bytes, file-like 객체 모두 가능 (iter_sa_violations 참고)"""
     comp_counts = defaultdict(int)
     comp_files = defaultdict(set)
     severity_counts = defaultdict(int)
@@ -15,11 +55,7 @@ def parse_sa_file_enhanced(report_xml_path: Path, debug: bool = False):
 
     ruleid_pattern = re.compile(r"\[AUTOSAR Rule ([^\]]+)\]")
 
-    for msg in messages:
-        file_node = msg.getElementsByTagName("file")
-        if not file_node or file_node[0].firstChild is None:
-            continue
-        file_path = file_node[0].firstChild.nodeValue.strip()
+    for file_path, severity, desc_text, _ in iter_sa_violations(report_xml_path):
         parts = Path(file_path).parts
         component = "etc"
         try:
@@ -32,12 +68,8 @@ def parse_sa_file_enhanced(report_xml_path: Path, debug: bool = False):
         comp_counts[component] += 1
         comp_files[component].add(file_path)
 
-        type_node = msg.getElementsByTagName("type")
-        severity = type_node[0].firstChild.nodeValue.strip() if type_node and type_node[0].firstChild else "Unknown"
         severity_counts[severity] += 1
 
-        desc_node = msg.getElementsByTagName("desc")
-        desc_text = desc_node[0].firstChild.nodeValue.strip() if desc_node and desc_node[0].firstChild else ""
         m = ruleid_pattern.search(desc_text)
         ruleid = m.group(1) if m else "etc"
         ruleid_counts[ruleid] += 1
@@ -0,0 +1,182 @@
+"""
+비용 기반 작업 스케줄러
+- 작업 단위(WorkUnit)의 비용을 입력 바이트 크기와 이전 실행 기록으로 추정
+- 추정 비용이 큰 작업부터 하나의 프로세스 풀에 제출 (LPT: longest processing time first)
+  단, priority 가 높은 작업(미리보기 등)은 비용과 관계없이 먼저 제출
+- 실행 시간은 사용자 캐시 폴더의 입력 폴더별 기록 파일에 저장해 다음 실행의 추정에 사용
+  (보고서 출력 폴더에는 쓰지 않으므로 CI 산출물에 포함되지 않는다)
+- 선행 작업(deps)이 있는 작업은 선행 작업이 모두 끝난 뒤 그 결과를 인자로 받아 실행
+"""
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+# 사용자 캐시 폴더 아래 실행 기록을 두는 폴더명
+CACHE_DIR_NAME = "gtest_report"
+
+# 기록이 없을 때 사용하는 작업 종류별 MB 당 예상 처리 시간(초)
+DEFAULT_SECONDS_PER_MB = {
+    "stage": 2.0,
+    "sa_summary": 0.3,
+    "sa_components": 0.4,
+    "parse_chunk": 1.2,
+    "preview": 0.3,
+}
+# 입력이 없거나 아주 작은 작업의 고정 비용(초)
+BASE_COST = 0.05
+
+
+def input_size(paths) -> int:
+    """입력 파일 크기 합 (없는 파일은 0)"""
+    total = 0
+    for p in paths:
+        try:
+            total += Path(p).stat().st_size
+        except OSError:
+            pass
+    return total
+
+
+def cache_dir() -> Path:
+    """실행 기록 폴더: $XDG_CACHE_HOME (Windows 는 %LOCALAPPDATA%), 없으면 ~/.cache 아래"""
+    base = os.environ.get("XDG_CACHE_HOME")
+    if not base and os.name == "nt":
+        base = os.environ.get("LOCALAPPDATA")
+    return Path(base or Path.home() / ".cache") / CACHE_DIR_NAME
+
+
+def default_history_path(input_root: Path) -> Path:
+    """입력 폴더(절대 경로)마다 하나의 기록 파일"""
+    digest = hashlib.sha1(str(Path(input_root).resolve()).encode("utf-8")).hexdigest()[:16]
+    return cache_dir() / f"history-{digest}.json"
+
+
+class CostHistory:
+    """
+    작업 키별 직전 실행의 (입력 바이트, 소요 시간) 기록.
+    같은 키의 기록이 있으면 바이트 비율로 시간을 보정해 추정한다.
+    """
+
+    def __init__(self, path: Path | None = None):
+        self.path = path
+        self.entries = {}
+        if path is not None and path.exists():
+            try:
+                self.entries = json.loads(path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                self.entries = {}
+
+    @classmethod
+    def for_input(cls, input_root: Path, path: Path | None = None) -> "CostHistory":
+        """path 를 주지 않으면 input_root 에 대한 캐시 폴더의 기본 기록 파일을 사용"""
+        return cls(Path(path) if path is not None else default_history_path(input_root))
+
+    def estimate(self, key: str, kind: str, size: int) -> float:
+        entry = self.entries.get(key)
+        if entry and entry.get("bytes"):
+            return BASE_COST + entry["seconds"] * size / entry["bytes"]
+        return BASE_COST + DEFAULT_SECONDS_PER_MB.get(kind, 1.0) * size / (1024 * 1024)
+
+    def record(self, key: str, size: int, seconds: float):
+        self.entries[key] = {"bytes": size, "seconds": round(seconds, 4)}
+
+    def save(self):
+        if self.path is None:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.path.write_text(json.dumps(self.entries, indent=2, sort_keys=True), encoding="utf-8")
+        except OSError:
+            pass
+
+
+class WorkUnit:
+    """
+    풀에서 실행할 작업 하나.
+    func 는 모듈 최상위 함수여야 하며(pickle 가능), 반환값은 run_units 가 돌려준다.
+    deps 의 작업이 모두 성공하면 그 반환값들을 args 뒤에 붙여 func 를 호출한다.
+    priority 가 큰 작업은 추정 비용과 관계없이 먼저 제출된다.
+    """
+
+    def __init__(self, key: str, kind: str, func, args: tuple, size: int,
+                 history: CostHistory | None = None, tag=None, deps: list["WorkUnit"] | None = None,
+                 priority: int = 0):
+        self.key = key
+        self.kind = kind
+        self.func = func
+        self.args = args
+        self.size = size
+        self.history = history or CostHistory()
+        self.tag = tag
+        self.deps = deps or []
+        self.priority = priority
+        self.cost = self.history.estimate(key, kind, size)
+
+
+def _run_unit(func, args):
+    start = time.perf_counter()
+    try:
+        value = func(*args)
+        return True, value, time.perf_counter() - start
+    except Exception as e:
+        return False, str(e), time.perf_counter() - start
+
+
+def run_units(units: list[WorkUnit], max_workers: int | None = None, executor=None):
+    """
+    (priority, 추정 비용) 내림차순으로 제출하고 끝나는 순서대로 (unit, success, value) 를 반환.
+    success 가 False 이면 value 는 오류 메시지.
+    units 의 선행 작업(deps)도 함께 실행하지만 결과는 반환하지 않으며,
+    선행 작업이 실패한 작업은 실행하지 않고 그 오류로 실패 처리한다.
+    executor 를 주지 않으면 새 ProcessPoolExecutor 를 만든다.
+    """
+    deps = []
+    for u in units:
+        for d in u.deps:
+            if not any(d is x for x in deps):
+                deps.append(d)
+    waiting = [u for u in units if u.deps]
+    finished = {}  # id(선행 작업) -> (success, value)
+
+    own_executor = executor is None
+    if own_executor:
+        executor = ProcessPoolExecutor(max_workers=max_workers)
+    future_map = {}
+
+    def submit(batch):
+        for unit, args in sorted(batch, key=lambda item: (item[0].priority, item[0].cost), reverse=True):
+            future_map[executor.submit(_run_unit, unit.func, args)] = unit
+
+    try:
+        submit([(u, u.args) for u in deps] + [(u, u.args) for u in units if not u.deps])
+        while future_map or waiting:
+            if future_map:
+                done, _ = wait(future_map, return_when=FIRST_COMPLETED)
+            else:
+                done = ()
+            for future in done:
+                unit = future_map.pop(future)
+                success, value, elapsed = future.result()
+                if success:
+                    unit.history.record(unit.key, unit.size, elapsed)
+                if any(unit is d for d in deps):
+                    finished[id(unit)] = (success, value)
+                else:
+                    yield unit, success, value
+
+            ready = []
+            for unit in [u for u in waiting if all(id(d) in finished for d in u.deps)]:
+                waiting.remove(unit)
+                results = [finished[id(d)] for d in unit.deps]
+                errors = [value for success, value in results if not success]
+                if errors:
+                    yield unit, False, errors[0]
+                else:
+                    ready.append((unit, unit.args + tuple(value for _, value in results)))
+            submit(ready)
+    finally:
+        if own_executor:
+            executor.shutdown()
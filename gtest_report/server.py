@@ -0,0 +1,390 @@
+"""
+로컬 보고서 서버 (gtest-report-serve, python -m gtest_report.server)
+- 입력 폴더를 한 번 파싱해 메모리에 두고, 페이지는 요청이 올 때 렌더링
+- 렌더링한 페이지는 LRU 캐시(크기 제한)에 보관하며, 렌더링 중에도 다른 요청(캐시 적중 포함)은 막지 않음
+- 입력 XML 이 추가/변경/삭제되면 다음 요청에서 다시 읽음
+- 표준 라이브러리 http.server 만 사용하며 외부 네트워크에 접근하지 않음
+
+    gtest-report-serve PARA in --port 8000
+
+URL:
+  /                           index.html
+  /<TYPE>_Report.html         단계별 보고서 (?file=<XML 파일명> 파일 하나, ?status=failed|skipped|success 상태별)
+  /SA_Report.html             정적분석 요약
+  /SA_Report_<component>.html 정적분석 컴포넌트별 보고서
+"""
+import sys
+import argparse
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import Future
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from .parser import TestFileResult, parse_files, summarize
+from .builder.html_builder import RESOURCE_DIR, generate_report, render_sa_report
+from .sa_component_report_generator import (
+    DEFAULT_ROW_BUDGET, collect_components, render_component, summarize_components,
+)
+from .sa_spill import ViolationStore
+from .stages import discover_stages
+from .cli import index_cells, index_html
+
+# 렌더링 결과 캐시 최대 크기 (MB)
+DEFAULT_CACHE_MB = 256
+# 입력 파일 변경 확인 최소 간격 (초)
+RELOAD_INTERVAL = 2.0
+
+STATUS_FILTERS = ("failed", "skipped", "success")
+
+CONTENT_TYPES = {
+    ".html": "text/html; charset=utf-8",
+    ".css": "text/css; charset=utf-8",
+    ".js": "application/javascript; charset=utf-8",
+    ".png": "image/png",
+}
+
+
+class PageCache:
+    """렌더링된 페이지(bytes)의 LRU 캐시. 전체 크기가 max_bytes 를 넘으면 오래된 것부터 버린다."""
+
+    def __init__(self, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._pages = OrderedDict()
+        self._size = 0
+
+    def get(self, key):
+        page = self._pages.get(key)
+        if page is not None:
+            self._pages.move_to_end(key)
+        return page
+
+    def put(self, key, page: bytes):
+        if len(page) > self.max_bytes:
+            return
+        old = self._pages.pop(key, None)
+        if old is not None:
+            self._size -= len(old)
+        self._pages[key] = page
+        self._size += len(page)
+        while self._size > self.max_bytes:
+            _, evicted = self._pages.popitem(last=False)
+            self._size -= len(evicted)
+
+    def clear(self):
+        self._pages.clear()
+        self._size = 0
+
+
+def _filter_results(parsed, file: str | None, status: str | None):
+    """
+    parse_files 결과를 XML 파일 하나 / 케이스 상태 하나로 좁혀 다시 집계.
+    file 과 일치하는 XML 이 없으면 None.
+    """
+    results = parsed[0]
+    if file:
+        results = [fr for fr in results if fr.filename == file]
+        if not results:
+            return None
+    if status:
+        filtered = []
+        for fr in results:
+            cases = [c for c in fr.cases if c.status == status]
+            filtered.append(TestFileResult(
+                filename=fr.filename,
+                total=len(cases),
+                failures=sum(1 for c in cases if c.status == "failed"),
+                skipped=sum(1 for c in cases if c.status == "skipped"),
+                duration=sum(c.time for c in cases),
+                timestamp=fr.timestamp,
+                cases=cases,
+            ))
+        results = filtered
+    return summarize(results)
+
+
+class SiteState:
+    """
+    한 번의 로드 결과 (읽기 전용 스냅샷).
+    요청은 시작할 때의 스냅샷으로 렌더링하므로, 다시 읽기로 교체되어도 렌더링 중인 요청이 끝난 뒤
+    마지막 참조가 사라질 때 SA 위반 목록(임시 파일 포함)을 닫는다.
+    """
+
+    def __init__(self, signature, stages, xmls, parsed, components, sa_data, store: ViolationStore):
+        self.signature = signature
+        self.stages = stages
+        self.xmls = xmls
+        self.parsed = parsed
+        self.components = components
+        self.sa_data = sa_data
+        self.store = store
+        self.report_date = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self._finalizer = weakref.finalize(self, store.close)
+
+    def close(self):
+        self._finalizer()
+
+
+class ReportSite:
+    """
+    입력 폴더 하나의 파싱 결과(SiteState)와 페이지 캐시.
+    잠금은 상태 교체와 캐시 조회/저장에만 짧게 잡고, 렌더링과 다시 읽기는 잠금 밖에서 한다.
+    같은 페이지를 동시에 요청하면 한 요청만 렌더링하고 나머지는 그 결과를 기다린다.
+    """
+
+    def __init__(self, project_name: str, input_root: Path, build_info: dict | None = None,
+                 row_budget: int = DEFAULT_ROW_BUDGET, memory_limit: int | None = None,
+                 cache_bytes: int = DEFAULT_CACHE_MB * 1024 * 1024):
+        self.project_name = project_name
+        self.input_root = input_root
+        self.build_info = dict(branch=None, release_tag=None, commit_id=None, build_number=None)
+        self.build_info.update(build_info or {})
+        self.row_budget = row_budget
+        self.memory_limit = memory_limit
+        self.cache = PageCache(cache_bytes)
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()
+        self._inflight = {}  # (state, key) -> Future
+        self.state = None
+        self._load()
+        self._checked = time.monotonic()
+
+    # --- 입력 로드 ---
+    def _input_files(self) -> list[Path]:
+        paths = [p for stage in discover_stages(self.input_root) for p in stage.xmls(self.input_root)]
+        sa_report_path = self.input_root / "SA" / "report.xml"
+        if sa_report_path.exists():
+            paths.append(sa_report_path)
+        return paths
+
+    def _current_signature(self):
+        signature = []
+        for p in self._input_files():
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            signature.append((str(p), st.st_mtime_ns, st.st_size))
+        return tuple(sorted(signature))
+
+    def _load(self):
+        """
+        입력을 새로 읽어 상태를 교체. 새 상태는 지역 변수로 만든 뒤 모두 성공했을 때만 바꿔 넣는다.
+        CLI 와 같이 단계/SA 별 파싱 오류는 로그만 남기고 그 단계는 NT 로 표시한다.
+        """
+        start = time.perf_counter()
+        signature = self._current_signature()
+        stages = discover_stages(self.input_root)
+        xmls = {stage.type: stage.xmls(self.input_root) for stage in stages}
+        parsed = {}
+        for stage in stages:
+            try:
+                parsed[stage.type] = parse_files(xmls[stage.type])
+            except Exception as e:
+                print(f"[ERROR] {stage.type}: {e}", file=sys.stderr)
+                parsed[stage.type] = None
+
+        store = ViolationStore(self.memory_limit)
+        components = {}
+        sa_data = {}
+        sa_report_path = self.input_root / "SA" / "report.xml"
+        if sa_report_path.exists():
+            try:
+                components = collect_components(sa_report_path, store)
+                sa_data = summarize_components(components)
+            except Exception as e:
+                print(f"[ERROR] SA: {e}", file=sys.stderr)
+                store.close()
+                store = ViolationStore(self.memory_limit)
+                components = {}
+
+        state = SiteState(signature, stages, xmls, parsed, components, sa_data, store)
+        with self._lock:
+            self.state = state
+            self.cache.clear()
+        print(f"Loaded {sum(len(x) for x in xmls.values())} XML files"
+              f"{' + SA report' if components else ''} in {time.perf_counter() - start:.1f}s")
+
+    def reload_if_changed(self):
+        """
+        RELOAD_INTERVAL 마다 입력 파일 목록/수정 시각을 비교해 바뀌었으면 다시 읽는다.
+        다시 읽는 동안 다른 요청은 기다리지 않고 이전 상태로 응답한다.
+        """
+        with self._lock:
+            if time.monotonic() - self._checked < RELOAD_INTERVAL:
+                return
+            self._checked = time.monotonic()
+        if not self._reload_lock.acquire(blocking=False):
+            return
+        try:
+            if self._current_signature() != self.state.signature:
+                print("Input changed, reloading...")
+                try:
+                    self._load()
+                except Exception as e:
+                    # 이전 상태를 그대로 두고, signature 가 바뀌지 않았으므로 다음 확인 때 다시 시도
+                    print(f"[ERROR] reload failed: {e}", file=sys.stderr)
+        finally:
+            self._reload_lock.release()
+
+    def close(self):
+        with self._lock:
+            if self.state is not None:
+                self.state.close()
+
+    # --- 페이지 ---
+    def page(self, name: str, query: dict) -> bytes | None:
+        """name(예: "UT_Report.html") 페이지를 캐시 또는 렌더링으로 반환. 없는 페이지는 None."""
+        file = query.get("file")
+        status = query.get("status")
+        if status and status not in STATUS_FILTERS:
+            return None
+        self.reload_if_changed()
+        key = (name, file, status)
+        with self._lock:
+            state = self.state
+            page = self.cache.get(key)
+            if page is not None:
+                return page
+            flight = self._inflight.get((state, key))
+            owner = flight is None
+            if owner:
+                flight = self._inflight[(state, key)] = Future()
+        if not owner:
+            return flight.result()
+
+        try:
+            html = self._render(state, name, file, status)
+            page = html.encode("utf-8") if html is not None else None
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[(state, key)]
+                # 렌더링 중 상태가 교체되었으면 이전 상태의 페이지는 캐시에 넣지 않는다
+                if page is not None and state is self.state:
+                    self.cache.put(key, page)
+        flight.set_result(page)
+        return page
+
+    def _render(self, state: SiteState, name: str, file: str | None, status: str | None) -> str | None:
+        if name in ("", "index.html"):
+            return index_html(
+                self.project_name,
+                report_date=state.report_date,
+                index_rows=[
+                    index_cells(s, state.xmls[s.type], state.parsed[s.type]) if state.parsed[s.type] is not None
+                    else index_cells(s, [])
+                    for s in state.stages
+                ],
+                sa_data=state.sa_data,
+                **self.build_info,
+            )
+        if name == "SA_Report.html":
+            return render_sa_report(self.project_name, state.sa_data) if state.sa_data else None
+        if name.startswith("SA_Report_") and name.endswith(".html"):
+            comp = name[len("SA_Report_"):-len(".html")]
+            data = state.components.get(comp)
+            return render_component(comp, data, state.store, self.row_budget) if data else None
+        for stage in state.stages:
+            if name == f"{stage.type}_Report.html":
+                parsed = state.parsed[stage.type]
+                if parsed is not None and (file or status):
+                    parsed = _filter_results(parsed, file, status)
+                if parsed is None:
+                    return None
+                return "".join(generate_report(self.project_name, stage.name, parsed))
+        return None
+
+
+def _resource(name: str) -> Path | None:
+    """html_resources 안의 파일만 허용"""
+    path = RESOURCE_DIR / name
+    if "/" in name or "\\" in name or not path.is_file():
+        return None
+    return path
+
+
+def make_handler(site: ReportSite):
+    class ReportHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            name = unquote(url.path).lstrip("/")
+            if name.startswith("html_resources/"):
+                path = _resource(name[len("html_resources/"):])
+                if path is None:
+                    self.send_error(HTTPStatus.NOT_FOUND)
+                    return
+                self._send(path.read_bytes(), CONTENT_TYPES.get(path.suffix, "application/octet-stream"))
+                return
+
+            query = {k: v[0] for k, v in parse_qs(url.query).items()}
+            try:
+                page = site.page(name, query)
+            except Exception as e:
+                self.send_error(HTTPStatus.INTERNAL_SERVER_ERROR, str(e))
+                return
+            if page is None:
+                self.send_error(HTTPStatus.NOT_FOUND)
+                return
+            self._send(page, CONTENT_TYPES[".html"])
+
+        def _send(self, body: bytes, content_type: str):
+            self.send_response(HTTPStatus.OK)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+    return ReportHandler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="gtest-report-serve",
+        description="Serve GTest/SA reports from a local HTTP server, rendering pages on demand",
+    )
+    parser.add_argument("project",    help="프로젝트명")
+    parser.add_argument("input_dir",  help="in 폴더 경로")
+    parser.add_argument("--host",     default="127.0.0.1", help="바인드 주소 (기본 127.0.0.1)")
+    parser.add_argument("--port",     type=int, default=8000, help="포트 (기본 8000)")
+    parser.add_argument("--branch",   help="Git 브랜치명",     default=None)
+    parser.add_argument("--tag",      help="Release Tag",      default=None)
+    parser.add_argument("--commit",   help="Commit ID",        default=None)
+    parser.add_argument("--build",    help="Jenkins Build #",   default=None)
+    parser.add_argument("--sa-row-budget", type=int, default=DEFAULT_ROW_BUDGET,
+                        help="SA 컴포넌트 페이지당 최대 상세 행 수")
+    parser.add_argument("--memory-limit", type=int, default=None, metavar="MB",
+                        help="SA 위반 목록 메모리 예산(MB). 초과분은 임시 파일로 내보냄")
+    parser.add_argument("--cache-mb", type=int, default=DEFAULT_CACHE_MB,
+                        help="렌더링한 페이지 캐시 크기(MB)")
+    args = parser.parse_args(argv)
+
+    site = ReportSite(
+        args.project,
+        Path(args.input_dir),
+        build_info=dict(branch=args.branch, release_tag=args.tag,
+                        commit_id=args.commit, build_number=args.build),
+        row_budget=args.sa_row_budget,
+        memory_limit=args.memory_limit * 1024 * 1024 if args.memory_limit else None,
+        cache_bytes=args.cache_mb * 1024 * 1024,
+    )
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(site))
+    print(f"Serving {args.project} at http://{args.host}:{server.server_address[1]}/ (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        site.close()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
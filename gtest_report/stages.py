@@ -0,0 +1,65 @@
+"""
+테스트 단계(stage) 정의와 입력 폴더 기반 단계 탐색
+"""
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+# 추가 단계로 인정하는 XML 루트 요소 (gtest / JUnit 결과)
+TEST_ROOT_TAGS = {"testsuites", "testsuite"}
+
+
+class Stage:
+    """
+    type: 보고서 파일명/인덱스 키 ({type}_Report.html)
+    name: 표시 이름
+    source: 입력 XML 폴더명 (in/<source>/*.xml)
+    suite_level: True 이면 Test Suite 단위로 집계 (UIT)
+    """
+
+    def __init__(self, type: str, name: str, source: str | None = None, suite_level: bool = False):
+        self.type = type
+        self.name = name
+        self.source = source or type
+        self.suite_level = suite_level
+
+    def xmls(self, input_root: Path) -> list[Path]:
+        return list((input_root / self.source).glob("*.xml"))
+
+
+DEFAULT_STAGES = [
+    Stage("UT", "Unit Test"),
+    Stage("UIT", "Unit Integration Test", source="UT", suite_level=True),
+    Stage("SCT", "Component Test"),
+    Stage("SCIT", "Component Integration Test"),
+    Stage("SRT", "SW Requirement Test"),
+]
+
+# 단계로 취급하지 않는 입력 폴더
+RESERVED_FOLDERS = {"SA"}
+
+
+def is_test_xml(path: Path) -> bool:
+    """첫 요소(루트)만 읽어 <testsuites>/<testsuite> 인지 확인. 읽을 수 없거나 XML 이 아니면 False"""
+    try:
+        with open(path, "rb") as f:
+            for _, elem in ET.iterparse(f, events=("start",)):
+                return elem.tag in TEST_ROOT_TAGS
+    except (OSError, ET.ParseError):
+        pass
+    return False
+
+
+def discover_stages(input_root: Path) -> list[Stage]:
+    """
+    기본 단계 + 입력 폴더에서 발견된 추가 단계.
+    기본 단계는 XML 이 없어도 인덱스에 NT 로 표시되도록 항상 포함하고,
+    그 외 테스트 결과 XML(루트가 <testsuites>/<testsuite>)이 들어 있는 하위 폴더는
+    폴더명을 type/표시 이름으로 하는 단계로 추가한다. 커버리지 등 다른 XML 만 있는 폴더는 무시한다.
+    """
+    stages = list(DEFAULT_STAGES)
+    known = RESERVED_FOLDERS | {s.type for s in stages} | {s.source for s in stages}
+    if input_root.is_dir():
+        for d in sorted(input_root.iterdir()):
+            if d.is_dir() and d.name not in known and any(is_test_xml(p) for p in d.glob("*.xml")):
+                stages.append(Stage(d.name, d.name))
+    return stages
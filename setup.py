@@ -13,6 +13,8 @@ setup(
     entry_points={
         "console_scripts": [
             "gtest-report = gtest_report.cli:main",
+            "gtest-report-batch = gtest_report.batch:main",
+            "gtest-report-serve = gtest_report.server:main",
         ],
     },
     package_data={
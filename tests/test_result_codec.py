@@ -0,0 +1,83 @@
+from pathlib import Path
+
+from gtest_report.cli import project_units
+from gtest_report.parser import TestCaseResult as CaseResult, TestFileResult as FileResult, parse_files
+from gtest_report.result_codec import DEFAULT_CHUNK_SIZE, ResultsView, encode_results, load_encoded, parse_to_file
+from gtest_report.scheduler import CostHistory, run_units
+from gtest_report.stages import discover_stages
+
+
+def _write_inputs(root: Path, n_files: int):
+    ut = root / "UT"
+    ut.mkdir(parents=True)
+    for i in range(n_files):
+        cases = [
+            f'<testcase classname="Suite{i % 3}" name="Ok{i}" time="0.01"/>',
+            f'<testcase classname="Suite{i % 3}" name="Fail{i}" time="0.02">'
+            f'<failure message="expected &lt;1&gt;">trace {i}</failure></testcase>',
+            f'<testcase classname="Suite{i % 3}" name="Skip{i}" time="0"><skipped message="why"/></testcase>',
+        ]
+        ut.joinpath(f"t{i:03}.xml").write_text(
+            f'<?xml version="1.0"?>\n<testsuites tests="3" failures="1" timestamp="2025-05-01T10:00:0{i % 10}Z">'
+            f'<testsuite name="Suite{i % 3}" tests="3" failures="1" time="0.03">{"".join(cases)}</testsuite>'
+            "</testsuites>"
+        )
+
+
+def _render(input_root: Path, output_root: Path, work_dir: Path | None) -> dict:
+    output_root.mkdir()
+    units = project_units("P", input_root, output_root, discover_stages(input_root), CostHistory(),
+                          work_dir=work_dir)
+    cells = {}
+    for unit, success, value in run_units(units, max_workers=2):
+        assert success, value
+        if unit.kind == "stage":
+            cells[unit.key] = value
+    return cells
+
+
+def test_load_encoded_matches_parse_files(tmp_path):
+    _write_inputs(tmp_path / "in", 5)
+    xmls = sorted((tmp_path / "in" / "UT").glob("*.xml"))
+    expected = parse_files(xmls)
+    view = ResultsView(encode_results(expected[0]))
+    assert view.totals() == tuple(expected[1:])
+    got = load_encoded([parse_to_file(xmls, directory=tmp_path)], delete=True)
+    assert got[1:] == expected[1:]
+    for a, b in zip(got[0], expected[0]):
+        assert (a.filename, a.total, a.failures, a.skipped, a.timestamp) == (b.filename, b.total, b.failures, b.skipped, b.timestamp)
+        assert [(c.name, c.status, c.failure_message) for c in a.cases] == \
+            [(c.name, c.status, c.failure_message) for c in b.cases]
+
+
+def test_non_standard_status_round_trips(tmp_path):
+    cases = [CaseResult("A", 0.1, "passed", ""), CaseResult("B", 0.2, "failed", "boom"),
+             CaseResult("C", 0.0, "disabled", "")]
+    fr = FileResult(filename="x.xml", total=3, failures=1, skipped=0, duration=0.3, timestamp=None,
+                        cases=cases)
+    view = ResultsView(encode_results([fr]))
+    assert [c.status for c in view.cases(0)] == ["passed", "failed", "disabled"]
+
+
+def test_encoded_file_removed_when_results_dropped(tmp_path):
+    _write_inputs(tmp_path / "in", 3)
+    path = Path(parse_to_file(sorted((tmp_path / "in" / "UT").glob("*.xml")), directory=tmp_path))
+    results = load_encoded([path], delete=True)[0]
+    assert results[0].cases and path.exists()
+    del results
+    assert not path.exists()
+
+
+def test_chunked_stage_parsing_renders_same_output(tmp_path):
+    input_root = tmp_path / "in"
+    _write_inputs(input_root, DEFAULT_CHUNK_SIZE * 2 + 5)
+    work_dir = tmp_path / "work"
+    work_dir.mkdir()
+
+    plain = _render(input_root, tmp_path / "plain", None)
+    chunked = _render(input_root, tmp_path / "chunked", work_dir)
+
+    assert chunked == plain
+    for name in ("UT_Report.html", "UIT_Report.html"):
+        assert (tmp_path / "chunked" / name).read_text(encoding="utf-8") == \
+            (tmp_path / "plain" / name).read_text(encoding="utf-8")